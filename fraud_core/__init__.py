@@ -0,0 +1,56 @@
+"""Retailer lookup, scoring, prompt and parsing logic shared by the Streamlit
+app, the batch jobs and any service endpoints.
+
+Names are imported from their submodules on first access, so ``import
+fraud_core`` does not pull in pandas or langchain.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "LayeredIndex": "retrieval",
+    "RetailerIndex": "retrieval",
+    "normalize_name": "retrieval",
+    "ResponseCache": "cache",
+    "settings_digest": "cache",
+    "LegitimacyScorer": "scoring",
+    "Verdict": "scoring",
+    "SellerStore": "store",
+    "ingest": "store",
+    "open_store": "store",
+    "DataReloader": "refresh",
+    "Snapshot": "refresh",
+    "Detail": "parsing",
+    "LineParser": "parsing",
+    "detail_box": "parsing",
+    "parse_detail": "parsing",
+    "DATA_FILES": "lookup",
+    "MODEL_NAME": "lookup",
+    "PROMPT_TEMPLATE": "lookup",
+    "TEMPERATURE": "lookup",
+    "TOP_K": "lookup",
+    "approx_tokens": "lookup",
+    "build_chain": "lookup",
+    "create_llm": "lookup",
+    "get_prompt": "lookup",
+    "get_retailer_details": "lookup",
+    "invoke_with_retries": "lookup",
+    "load_data": "lookup",
+    "prompt_inputs": "lookup",
+    "stream_retailer_details": "lookup",
+    "StubChatModel": "stub_llm",
+    "METRICS": "metrics",
+    "Metrics": "metrics",
+    "configure_from_env": "metrics",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
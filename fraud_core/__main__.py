@@ -0,0 +1,73 @@
+"""Import-time budget check for the core package.
+
+Usage:
+    python -m fraud_core [--budget-ms 100]
+
+Imports the package and its lightweight modules in a fresh interpreter and
+exits non-zero if that takes longer than the budget or loads any of the
+heavy dependencies that the UI should only pay for once per process.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# Modules a Streamlit rerun imports on every run
+LIGHT_MODULES = [
+    "fraud_core",
+    "fraud_core.lookup",
+    "fraud_core.retrieval",
+    "fraud_core.cache",
+    "fraud_core.parsing",
+    "fraud_core.metrics",
+]
+
+# Dependencies that must only be imported when first used
+HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "langchain_core", "langchain_mistralai"]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - started
+print(json.dumps({{"import_ms": elapsed * 1000, "heavy": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+# Milliseconds the light modules may take to import
+BUDGET_MS = 100.0
+
+
+def probe():
+    # Import time and heavy modules loaded, measured in a fresh interpreter
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(modules=LIGHT_MODULES, heavy=HEAVY_MODULES)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that importing fraud_core stays within budget.")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    result = probe()
+    print(f"import fraud_core: {result['import_ms']:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if result["import_ms"] > args.budget_ms:
+        print("import time is over budget", file=sys.stderr)
+        failed = True
+    if result["heavy"]:
+        print(f"heavy modules imported eagerly: {', '.join(result['heavy'])}", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""Headless bulk screening of supplier lists.
+
+Usage:
+    python -m fraud_core.batch names.csv -o results.jsonl --concurrency 16 --rate 5
+    python -m fraud_core.batch names.jsonl -o results.jsonl --stub
+
+Names are read from a CSV (``--column``, default ``name``, else the first
+column) or a JSONL file. Results are appended to the output file as they
+complete, and names already present in it are skipped, so an interrupted
+run can be resumed by running the same command again. Names whose record
+carries an ``error`` are screened again and get a new record appended.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+from .lookup import TOP_K, build_chain, create_llm, load_data, prompt_inputs, record_usage
+from .metrics import METRICS, configure_from_env
+from .retrieval import RetailerIndex
+from .scoring import LegitimacyScorer
+
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` calls per second with bursts up to ``capacity``."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def read_names(path, column="name"):
+    # Yields names one at a time so large lists are never held in memory
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                yield record.get(column) if isinstance(record, dict) else str(record)
+    else:
+        with open(path, newline="", encoding="utf-8") as handle:
+            reader = csv.DictReader(handle)
+            field = column if column in (reader.fieldnames or []) else (reader.fieldnames or [None])[0]
+            for record in reader:
+                yield record.get(field)
+
+
+def completed_names(path):
+    # Names already written by a previous (possibly interrupted) run; failed ones are retried
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+                if "error" not in record:
+                    done.add(record["name"])
+            except (ValueError, KeyError, TypeError):
+                # A partially written last line from an interrupted run
+                continue
+    return done
+
+
+async def call_with_retries(chain, inputs, bucket, retries, backoff, request=None):
+    for attempt in range(retries + 1):
+        if bucket is not None:
+            await bucket.acquire()
+        try:
+            with METRICS.span("llm", request):
+                run = await chain.ainvoke(inputs)
+            record_usage(request, run)
+            return run.content
+        except Exception:
+            if attempt == retries:
+                raise
+            METRICS.add(request, "retries")
+            await asyncio.sleep(backoff * 2 ** attempt * (1 + random.random()))
+
+
+def json_value(value):
+    # JSON has no NaN; missing values are written as null
+    return None if pd.isna(value) else value
+
+
+async def screen(names, output, data, index, scorer, chain=None, concurrency=8, rate=None, retries=3, backoff=1.0):
+    done = completed_names(output)
+    bucket = TokenBucket(rate) if rate else None
+    queue = asyncio.Queue(maxsize=concurrency * 2)
+    counts = {"written": 0, "skipped": 0, "errors": 0}
+
+    with open(output, "a", encoding="utf-8") as sink:
+
+        async def screen_name(name):
+            record = {"name": name}
+            rows = index.search(name, k=TOP_K)
+            if not rows:
+                record["verdict"] = "No information available"
+                return record
+            best = rows[0]
+            verdict = scorer.verdict(best)
+            record.update(
+                seller_id=json_value(data["Seller_ID"].iloc[best]),
+                company_name=json_value(data["Company_Name"].iloc[best]),
+                verdict=verdict.verdict,
+                score=verdict.score,
+                contributions=verdict.contributions,
+            )
+            if chain is not None:
+                request = METRICS.start_request("batch")
+                try:
+                    record["narrative"] = await call_with_retries(
+                        chain, prompt_inputs(data, rows, name), bucket, retries, backoff, request
+                    )
+                    METRICS.finish_request(request)
+                except Exception as e:
+                    METRICS.finish_request(request, e)
+                    record["error"] = str(e)
+            return record
+
+        async def worker():
+            while True:
+                name = await queue.get()
+                if name is None:
+                    return
+                # A failure on one name is recorded and the worker moves on; if workers died, the
+                # producer would block on a full queue forever
+                try:
+                    record = await screen_name(name)
+                    line = json.dumps(record, allow_nan=False)
+                except Exception as e:
+                    record = {"name": name, "error": str(e)}
+                    line = json.dumps(record)
+                if "error" in record:
+                    counts["errors"] += 1
+                sink.write(line + "\n")
+                sink.flush()
+                counts["written"] += 1
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        for name in names:
+            if not name or name in done:
+                counts["skipped"] += 1
+                continue
+            done.add(name)
+            await queue.put(name)
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Screen a list of retailer names in bulk.")
+    parser.add_argument("input", help="CSV or JSONL file with retailer names")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file results are appended to")
+    parser.add_argument("--column", default="name", help="column or key holding the retailer name")
+    parser.add_argument("--concurrency", type=int, default=8, help="maximum LLM calls in flight")
+    parser.add_argument("--rate", type=float, default=None, help="maximum LLM calls per second")
+    parser.add_argument("--retries", type=int, default=3, help="retries per name on LLM errors")
+    parser.add_argument("--backoff", type=float, default=1.0, help="initial retry delay in seconds")
+    parser.add_argument("--no-llm", action="store_true", help="only compute the scoring verdicts")
+    parser.add_argument("--stub", action="store_true", help="use the local stub model instead of Mistral")
+    parser.add_argument("--stub-latency", type=float, default=0.0, help="seconds the stub model waits per call")
+    args = parser.parse_args(argv)
+
+    configure_from_env()
+    data = load_data()
+    index = RetailerIndex(data)
+    scorer = LegitimacyScorer(data)
+
+    chain = None
+    if args.stub:
+        from .stub_llm import StubChatModel
+        chain = build_chain(StubChatModel(latency=args.stub_latency))
+    elif not args.no_llm:
+        chain = build_chain(create_llm())
+
+    started = time.perf_counter()
+    counts = asyncio.run(
+        screen(
+            read_names(args.input, args.column),
+            args.output,
+            data,
+            index,
+            scorer,
+            chain=chain,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            retries=args.retries,
+            backoff=args.backoff,
+        )
+    )
+    elapsed = time.perf_counter() - started
+    rate = counts["written"] / elapsed if elapsed else 0.0
+    print(
+        f"{counts['written']} rows written, {counts['skipped']} skipped, {counts['errors']} errors "
+        f"in {elapsed:.2f}s ({rate:.1f} rows/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
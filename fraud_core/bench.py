@@ -0,0 +1,243 @@
+"""Benchmark suite for the lookup pipeline, run against synthetic data and the stub model.
+
+Usage:
+    python -m fraud_core.bench --rows 50 10000 1000000 -o bench.json
+    python -m fraud_core.bench --rows 50 10000 --baseline bench.json
+
+Each catalog size is generated with fraud_core.synth. The suite times data
+loading, name lookup, prompt building (and its size in characters and
+approximate tokens), end-to-end get_retailer_details against the stub
+model, parsing/rendering of the answer, and a data refresh applying a
+small delta of new and changed sellers. Results are written as JSON.
+With ``--baseline``, the run is compared to an earlier result and exits
+non-zero when a prompt got larger or a latency regressed beyond
+``--tolerance``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from .lookup import TOP_K, approx_tokens, build_chain, get_prompt, get_retailer_details, load_data, prompt_inputs, stream_retailer_details
+from .parsing import LineParser, detail_box
+from .refresh import DataReloader
+from .retrieval import RetailerIndex
+from .scoring import LegitimacyScorer
+from .stub_llm import StubChatModel
+from .synth import sellers_frame, write_csvs
+
+# Rows appended per refresh round, half of them new versions of existing sellers
+REFRESH_ROWS = 100
+
+# Latency changes smaller than these (in the metric's own unit) are treated as noise
+NOISE_FLOORS = {"_us": 50.0, "_ms": 1.0, "_seconds": 0.01}
+
+
+def summarize(samples, scale=1.0):
+    values = np.asarray(samples, dtype="float64") * scale
+    return {
+        "mean": round(float(values.mean()), 3),
+        "p50": round(float(np.percentile(values, 50)), 3),
+        "p95": round(float(np.percentile(values, 95)), 3),
+        "max": round(float(values.max()), 3),
+    }
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def queries(data, samples, seed):
+    # Exact, differently cased and misspelled variants of real names, plus misses
+    rng = np.random.default_rng(seed)
+    names = data["Company_Name"]
+    picks = [str(names.iloc[int(row)]) for row in rng.integers(0, len(data), samples)]
+    variants = []
+    for position, name in enumerate(picks):
+        kind = position % 4
+        if kind == 0:
+            variants.append(name)
+        elif kind == 1:
+            variants.append(name.lower() + " inc.")
+        elif kind == 2:
+            cut = len(name) // 2
+            variants.append(name[:cut] + name[cut + 1:])
+        else:
+            variants.append(f"Unknown Seller {position}")
+    return variants
+
+
+def run(rows, directory, samples=200, latency=0.0, tokens_per_second=0.0, seed=0):
+    result = {"rows": rows}
+    sources = write_csvs(os.path.join(directory, str(rows)), rows, seed)
+    store_path = os.path.join(directory, f"{rows}.arrow")
+
+    # Data load: cold ingestion from CSV, then a warm open of the store
+    _, ingest_seconds = timed(load_data, sources, store_path)
+    data, open_seconds = timed(load_data, sources, store_path)
+    index, index_seconds = timed(RetailerIndex, data)
+    scorer, scorer_seconds = timed(LegitimacyScorer, data)
+    result["data_load"] = {
+        "ingest_seconds": round(ingest_seconds, 4),
+        "open_seconds": round(open_seconds, 4),
+        "index_build_seconds": round(index_seconds, 4),
+        "scorer_build_seconds": round(scorer_seconds, 4),
+    }
+
+    names = queries(data, samples, seed)
+
+    lookups = []
+    matched = []
+    for name in names:
+        found, seconds = timed(index.search, name, TOP_K)
+        lookups.append(seconds)
+        if found:
+            matched.append((name, found))
+    verdicts = [timed(scorer.verdict, found[0])[1] for _, found in matched]
+    result["name_lookup"] = {
+        "queries": len(names),
+        "hit_rate": round(len(matched) / len(names), 3),
+        "search_us": summarize(lookups, 1e6),
+        "verdict_us": summarize(verdicts or [0.0], 1e6),
+    }
+
+    prompt = get_prompt()
+    build_times, chars, tokens = [], [], []
+    for name, found in matched:
+        started = time.perf_counter()
+        text = prompt.format(**prompt_inputs(data, found, name))
+        build_times.append(time.perf_counter() - started)
+        chars.append(len(text))
+        tokens.append(approx_tokens(text))
+    result["prompt_build"] = {
+        "build_us": summarize(build_times or [0.0], 1e6),
+        "chars": summarize(chars or [0]),
+        "tokens": summarize(tokens or [0]),
+    }
+
+    chain = build_chain(StubChatModel(latency=latency, tokens_per_second=tokens_per_second))
+    answers, totals, first_chunks = [], [], []
+    for name in names:
+        answer, seconds = timed(get_retailer_details, name, data, index, chain)
+        answers.append(answer)
+        totals.append(seconds)
+        started = time.perf_counter()
+        next(iter(stream_retailer_details(name, data, index, chain)))
+        first_chunks.append(time.perf_counter() - started)
+    result["end_to_end"] = {
+        "stub_latency_seconds": latency,
+        "stub_tokens_per_second": tokens_per_second,
+        "total_ms": summarize(totals, 1e3),
+        "first_chunk_ms": summarize(first_chunks, 1e3),
+    }
+
+    renders = []
+    for answer in answers:
+        started = time.perf_counter()
+        parser = LineParser()
+        details = parser.feed(answer) + parser.flush()
+        html = "".join(detail_box(detail.label, detail.value, detail.box_style) for detail in details)
+        renders.append(time.perf_counter() - started)
+    result["parse_render"] = {"render_us": summarize(renders, 1e6), "last_html_chars": len(html)}
+
+    # Refresh: the first delta also builds the seller key lookup, later ones only cost the delta
+    reloader = DataReloader(sources, store_path)
+    rng = np.random.default_rng(seed)
+    refreshes = []
+    for position in range(6):
+        delta = sellers_frame(rows + position * REFRESH_ROWS, REFRESH_ROWS, rng)
+        changed = rng.integers(0, max(rows - rows // 2, 1), REFRESH_ROWS // 2)
+        delta.loc[: len(changed) - 1, "Seller_ID"] = [f"S{int(row):07d}" for row in changed]
+        with open(sources[0], "a", encoding="utf-8") as handle:
+            handle.write(delta.to_csv(header=False, index=False))
+        refreshes.append(timed(reloader.refresh)[1])
+    result["refresh"] = {
+        "delta_rows": REFRESH_ROWS,
+        "first_refresh_ms": round(refreshes[0] * 1e3, 3),
+        "refresh_ms": summarize(refreshes[1:], 1e3),
+    }
+    return result
+
+
+def flatten(node, prefix=""):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from flatten(value, f"{prefix}{key}.")
+    elif isinstance(node, (int, float)):
+        yield prefix[:-1], node
+
+
+def regressions(current, baseline, tolerance):
+    # Any growth in prompt size counts; latencies may drift by ``tolerance``
+    found = []
+    previous = {run["rows"]: dict(flatten(run)) for run in baseline["runs"]}
+    for run in current["runs"]:
+        before = previous.get(run["rows"])
+        if before is None:
+            continue
+        for key, value in flatten(run):
+            old = before.get(key)
+            if old is None:
+                continue
+            if key.startswith("prompt_build.chars") or key.startswith("prompt_build.tokens"):
+                if value > old:
+                    found.append(f"{run['rows']} rows: {key} grew from {old} to {value}")
+            elif (key.endswith(".p95") or key.endswith("_seconds")) and "stub_" not in key:
+                floor = next((floor for unit, floor in NOISE_FLOORS.items() if unit in key), 0)
+                if value > old * (1 + tolerance) and value - old > floor:
+                    found.append(f"{run['rows']} rows: {key} regressed from {old} to {value}")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the retailer lookup pipeline.")
+    parser.add_argument("--rows", nargs="+", type=int, default=[50, 10_000], help="catalog sizes to benchmark")
+    parser.add_argument("--samples", type=int, default=200, help="lookups per catalog size")
+    parser.add_argument("--latency", type=float, default=0.0, help="stub model time to first token in seconds")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="stub model output rate (0 is instant)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="write results here instead of stdout")
+    parser.add_argument("--baseline", help="earlier results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative latency regression")
+    args = parser.parse_args(argv)
+
+    results = {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "samples": args.samples,
+        },
+        "runs": [],
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.rows:
+            results["runs"].append(run(rows, directory, args.samples, args.latency, args.tokens_per_second, args.seed))
+            print(f"benchmarked {rows} rows", file=sys.stderr)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            found = regressions(results, json.load(handle), args.tolerance)
+        for message in found:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
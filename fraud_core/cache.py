@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from .retrieval import normalize_name
+
+
+# Format of the cache keys and stored answers; bump it when either changes meaning, and entries
+# written in another format are dropped when the cache is opened
+CACHE_FORMAT = "2"
+
+
+def settings_digest(**settings):
+    # Hash of the prompt and model settings that shape an answer
+    payload = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier cache for LLM answers: an in-process LRU in front of SQLite.
+
+    The SQLite file survives restarts and can be shared between worker
+    processes. Keys cover the ``context`` an answer was computed from (the
+    candidate rows sent to the model), so a data refresh only invalidates
+    the answers whose rows changed.
+    """
+
+    def __init__(self, path, settings="", max_entries=10000, memory_entries=256, ttl=7 * 24 * 3600):
+        self.path = path
+        self.version = CACHE_FORMAT
+        self.settings = settings
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                version TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        with self.db:
+            # Drop entries written in an older format
+            self.db.execute("DELETE FROM responses WHERE version != ?", (self.version,))
+
+    def key(self, retailer_name, context=""):
+        raw = "\0".join([normalize_name(retailer_name), self.version, self.settings, context])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, retailer_name, context=""):
+        key = self.key(retailer_name, context)
+        now = time.time()
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None and now - entry[1] < self.ttl:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.memory.pop(key, None)
+
+            row = self.db.execute(
+                "SELECT value, created_at FROM responses WHERE key = ? AND version = ?",
+                (key, self.version),
+            ).fetchone()
+            if row is None or now - row[1] >= self.ttl:
+                self.misses += 1
+                return None
+            with self.db:
+                self.db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._remember(key, row[0], row[1])
+            self.hits += 1
+            return row[0]
+
+    def put(self, retailer_name, value, context=""):
+        key = self.key(retailer_name, context)
+        now = time.time()
+        with self.lock:
+            self._remember(key, value, now)
+            with self.db:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO responses (key, version, value, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, self.version, value, now, now),
+                )
+                # Drop expired entries, then the least recently used beyond the size limit
+                self.db.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+                self.db.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def clear(self):
+        with self.lock:
+            self.memory.clear()
+            with self.db:
+                self.db.execute("DELETE FROM responses")
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "memory_entries": len(self.memory)}
+
+    def _remember(self, key, value, created_at):
+        self.memory[key] = (value, created_at)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
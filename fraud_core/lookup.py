@@ -0,0 +1,169 @@
+import functools
+import time
+
+from .metrics import METRICS
+
+# pandas, pyarrow and langchain are imported inside the functions that need them,
+# so importing this module stays cheap for the UI and for tools that only need the settings
+
+# Model settings
+MODEL_NAME = "mistral-large-latest"
+TEMPERATURE = 0
+
+# Retries of a failed LLM call; done here rather than in the client so they can be counted
+LLM_RETRIES = 2
+
+# Number of candidate rows passed to the LLM for each search
+TOP_K = 5
+
+# Dataset files; both are merged into one typed schema by the store
+DATA_FILES = ["data.csv", "data_retailers.csv"]
+
+# Prompt used for every retailer lookup
+PROMPT_TEMPLATE = """You are provided with a dataset containing details of retailers selling their products on e-commerce platforms.
+            Your job is to provide the details of the retailer about whom it is asked and determine whether the given retailer is legitimate or verified or not.
+            If the data does not have any information, simply answer as 'No information available'. Do not give further explanation or description.
+            Data:{data}
+            Retailer:{retailer}
+            Present the answer in bullet point format. Please make sure to ultimate judgement whether the retailer is legitimate or not, Also give the address and country of origin and give clean text without any special characters or stylings."""
+
+
+def load_data(paths=DATA_FILES, store_path=None):
+    from .store import STORE_PATH, open_store
+
+    # Memory-mapped columnar store, re-ingested when a dataset file changes
+    return open_store(paths, store_path or STORE_PATH)
+
+
+def create_llm(max_retries=0):
+    from langchain_mistralai import ChatMistralAI
+
+    return ChatMistralAI(
+        model=MODEL_NAME,
+        temperature=TEMPERATURE,
+        max_retries=max_retries,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_prompt():
+    from langchain_core.prompts import ChatPromptTemplate
+
+    # Built once per process and shared by every chain
+    return ChatPromptTemplate.from_messages([("human", PROMPT_TEMPLATE)])
+
+
+def build_chain(llm):
+    return get_prompt() | llm
+
+
+def prompt_inputs(data, rows, retailer_name):
+    # Only the candidate rows go into the prompt; columns empty for all of them are dropped
+    candidates = data.take(rows).dropna(axis=1, how="all")
+    return {
+        "data": candidates.to_csv(index=False),
+        "retailer": retailer_name,
+    }
+
+
+def approx_tokens(text):
+    # Rough token count (about four characters per token) for sizing prompts offline
+    return max(1, len(text) // 4) if text else 0
+
+
+def record_usage(request, message):
+    # Token counts as reported by the model, when it reports them
+    usage = getattr(message, "usage_metadata", None) or {}
+    METRICS.add(request, "prompt_tokens", usage.get("input_tokens", 0))
+    METRICS.add(request, "completion_tokens", usage.get("output_tokens", 0))
+
+
+def invoke_with_retries(chain, inputs, request=None, retries=LLM_RETRIES, backoff=1.0):
+    for attempt in range(retries + 1):
+        try:
+            return chain.invoke(inputs)
+        except Exception:
+            if attempt == retries:
+                raise
+            METRICS.add(request, "retries")
+            time.sleep(backoff * 2 ** attempt)
+
+
+def get_retailer_details(retailer_name, data, index, chain, cache=None, request=None):
+    # A request passed in is left open, so the caller can add its own spans (such as rendering) before finishing it
+    if request is not None:
+        return lookup_details(retailer_name, data, index, chain, cache, request)
+    request = METRICS.start_request("lookup")
+    try:
+        content = lookup_details(retailer_name, data, index, chain, cache, request)
+    except Exception as e:
+        METRICS.finish_request(request, e)
+        raise
+    METRICS.finish_request(request)
+    return content
+
+
+def lookup_details(retailer_name, data, index, chain, cache, request):
+    with METRICS.span("search", request):
+        rows = index.search(retailer_name, k=TOP_K)
+    if not rows:
+        return "No information available"
+    # Built before the cache lookup: answers are cached against the candidate rows they came from
+    with METRICS.span("prompt", request):
+        inputs = prompt_inputs(data, rows, retailer_name)
+    if cache is not None:
+        with METRICS.span("cache", request):
+            cached = cache.get(retailer_name, inputs["data"])
+        if cached is not None:
+            return cached
+
+    with METRICS.span("llm", request):
+        run = invoke_with_retries(chain, inputs, request)
+    record_usage(request, run)
+    if cache is not None:
+        cache.put(retailer_name, run.content, inputs["data"])
+    return run.content
+
+
+def stream_retailer_details(retailer_name, data, index, chain, cache=None, request=None):
+    # Same as get_retailer_details, but yields the answer in chunks as the LLM writes it
+    if request is not None:
+        yield from stream_details(retailer_name, data, index, chain, cache, request)
+        return
+    request = METRICS.start_request("stream")
+    try:
+        yield from stream_details(retailer_name, data, index, chain, cache, request)
+    except Exception as e:
+        METRICS.finish_request(request, e)
+        raise
+    METRICS.finish_request(request)
+
+
+def stream_details(retailer_name, data, index, chain, cache, request):
+    with METRICS.span("search", request):
+        rows = index.search(retailer_name, k=TOP_K)
+    if not rows:
+        yield "No information available"
+        return
+    with METRICS.span("prompt", request):
+        inputs = prompt_inputs(data, rows, retailer_name)
+    if cache is not None:
+        with METRICS.span("cache", request):
+            cached = cache.get(retailer_name, inputs["data"])
+        if cached is not None:
+            yield cached
+            return
+
+    parts = []
+    started = time.perf_counter()
+    for chunk in chain.stream(inputs):
+        if not parts and request is not None:
+            METRICS.observe("first_chunk_seconds", time.perf_counter() - started)
+        record_usage(request, chunk)
+        parts.append(chunk.content)
+        yield chunk.content
+    if request is not None:
+        request["spans"]["llm"] = time.perf_counter() - started
+        METRICS.observe("llm_seconds", request["spans"]["llm"])
+    if cache is not None:
+        cache.put(retailer_name, "".join(parts), inputs["data"])
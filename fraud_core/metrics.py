@@ -0,0 +1,209 @@
+"""In-process latency and token instrumentation for the lookup pipeline.
+
+Disabled unless ``RETAILER_METRICS=1`` is set (or ``METRICS.enabled`` is
+switched on); when disabled, spans are a shared no-op context manager and
+every other call returns immediately.
+
+When enabled, each stage is timed into a rolling histogram and every
+request records its stage timings, prompt/completion tokens and LLM
+retries. Metrics are exported as Prometheus text:
+
+- ``RETAILER_METRICS_FILE=path`` rewrites the file after each request
+- ``RETAILER_METRICS_PORT=9108`` serves it over HTTP at ``/metrics``
+"""
+
+import contextlib
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+
+# Prefix of every exported metric name
+NAMESPACE = "retailer"
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Per-request values that also get a histogram
+REQUEST_FIELDS = ("prompt_tokens", "completion_tokens", "retries")
+
+NULL_SPAN = contextlib.nullcontext()
+
+
+class Histogram:
+    """Rolling window of recent observations plus lifetime count and sum."""
+
+    def __init__(self, window):
+        self.values = deque(maxlen=window)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.values.append(value)
+        self.count += 1
+        self.sum += value
+
+    def quantiles(self):
+        values = sorted(self.values)
+        if not values:
+            return {quantile: 0.0 for quantile in QUANTILES}
+        return {quantile: values[min(len(values) - 1, int(quantile * len(values)))] for quantile in QUANTILES}
+
+
+class Span:
+    def __init__(self, metrics, name, request):
+        self.metrics = metrics
+        self.name = name
+        self.request = request
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.started
+        self.metrics.observe(f"{self.name}_seconds", elapsed)
+        if self.request is not None:
+            spans = self.request["spans"]
+            spans[self.name] = spans.get(self.name, 0.0) + elapsed
+        return False
+
+
+class Metrics:
+    def __init__(self, enabled=False, window=1000, recent=50):
+        self.enabled = enabled
+        self.window = window
+        self.histograms = {}
+        self.counters = defaultdict(float)
+        self.requests = deque(maxlen=recent)
+        self.lock = threading.Lock()
+        self.export_path = None
+
+    def span(self, name, request=None):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, request)
+
+    def observe(self, name, value):
+        if not self.enabled:
+            return
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(self.window)
+            histogram.observe(value)
+
+    def increment(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] += amount
+
+    def start_request(self, name):
+        # Returns the record that spans and counts of one lookup are added to, or None when disabled
+        if not self.enabled:
+            return None
+        request = {"name": name, "started_at": time.time(), "spans": {}, "error": None}
+        request.update({field: 0 for field in REQUEST_FIELDS})
+        request["clock"] = time.perf_counter()
+        return request
+
+    def add(self, request, field, amount=1):
+        if request is None:
+            return
+        request[field] += amount
+        self.increment(f"{field}_total", amount)
+
+    def finish_request(self, request, error=None):
+        if request is None:
+            return
+        request["error"] = None if error is None else str(error)
+        request["spans"]["request"] = time.perf_counter() - request.pop("clock")
+        self.observe("request_seconds", request["spans"]["request"])
+        for field in REQUEST_FIELDS:
+            self.observe(field, request[field])
+        self.increment("requests_total")
+        if error is not None:
+            self.increment("request_errors_total")
+        with self.lock:
+            self.requests.append(request)
+        if self.export_path:
+            try:
+                self.write_prometheus(self.export_path)
+            except Exception:
+                # The request itself succeeded; a failed export must not turn it into an error
+                self.increment("export_errors_total")
+
+    def snapshot(self):
+        with self.lock:
+            histograms = {
+                name: {"count": histogram.count, "sum": histogram.sum, **{f"p{int(q * 100)}": v for q, v in histogram.quantiles().items()}}
+                for name, histogram in self.histograms.items()
+            }
+            return {"histograms": histograms, "counters": dict(self.counters), "requests": list(self.requests)}
+
+    def render_prometheus(self):
+        snapshot = self.snapshot()
+        lines = []
+        for name, histogram in sorted(snapshot["histograms"].items()):
+            metric = f"{NAMESPACE}_{name}"
+            lines.append(f"# TYPE {metric} summary")
+            for quantile in QUANTILES:
+                lines.append(f'{metric}{{quantile="{quantile}"}} {histogram[f"p{int(quantile * 100)}"]}')
+            lines.append(f"{metric}_sum {histogram['sum']}")
+            lines.append(f"{metric}_count {histogram['count']}")
+        for name, value in sorted(snapshot["counters"].items()):
+            metric = f"{NAMESPACE}_{name}"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        # Written to a temporary file first so scrapers never read a partial file; each writer gets its
+        # own, as requests finishing at the same time export concurrently
+        handle, temporary = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as sink:
+                sink.write(self.render_prometheus())
+            # mkstemp creates the file private; scrapers often run as another user
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+    def serve(self, port, host="0.0.0.0"):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") not in ("", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+        return server
+
+
+METRICS = Metrics(enabled=os.environ.get("RETAILER_METRICS") == "1")
+
+
+def configure_from_env():
+    # Starts the exporters requested in the environment; call once per process
+    if not METRICS.enabled:
+        return None
+    METRICS.export_path = os.environ.get("RETAILER_METRICS_FILE") or None
+    port = os.environ.get("RETAILER_METRICS_PORT")
+    return METRICS.serve(int(port)) if port else None
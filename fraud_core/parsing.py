@@ -0,0 +1,63 @@
+from collections import namedtuple
+
+Detail = namedtuple("Detail", ["label", "value", "box_style"])
+
+
+def legitimacy_style(label, value):
+    # Colour the legitimacy line green or red depending on the judgement
+    if "legitimacy" not in label.lower():
+        return ""
+    value = value.lower()
+    if "not legitimate" in value or "illegitimate" in value or value.startswith("no"):
+        return "not-legitimate"
+    if "legitimate" in value:
+        return "legitimate"
+    return ""
+
+
+def parse_detail(line):
+    # Turns one bullet line of the answer into a label/value pair
+    line = line.strip()
+    if not line:
+        return None
+    if ":" in line:
+        label, value = line.split(":", 1)
+        label = label.strip().lstrip("-*• ").strip()
+        value = value.strip()
+    else:
+        label = "Unknown"
+        value = line.lstrip("-*• ").strip()
+    return Detail(label, value, legitimacy_style(label, value))
+
+
+class LineParser:
+    """Incremental parser for a streamed answer.
+
+    Text is fed in arbitrary chunks; each call returns the details for the
+    lines completed by that chunk, and ``flush`` returns the last one.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, chunk):
+        self.buffer += chunk
+        *lines, self.buffer = self.buffer.split("\n")
+        return [detail for detail in map(parse_detail, lines) if detail is not None]
+
+    def flush(self):
+        detail = parse_detail(self.buffer)
+        self.buffer = ""
+        return [detail] if detail is not None else []
+
+
+def detail_box(label, value, box_style="", note=""):
+    # HTML for one label/value box of the results grid
+    note_content = f'<div class="detail-box-note">{note}</div>' if note else ""
+    return f"""
+    <div class="detail-box {box_style}">
+        <div class="detail-box-label">{label}</div>
+        <div class="detail-box-value">{value}</div>
+        {note_content}
+    </div>
+    """
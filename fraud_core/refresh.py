@@ -0,0 +1,395 @@
+"""Hot reload of the seller data while the app keeps serving.
+
+``DataReloader`` watches the dataset CSVs and, optionally, an append-only
+JSONL delta feed, and applies only the rows that changed:
+
+- lines appended to a CSV are parsed from where the previous read stopped
+- a CSV that was replaced is diffed against the live rows loaded from it,
+  by Seller_ID and row content; the file is authoritative for its sellers
+- feed lines are ``{"op": "upsert", "source": "data.csv", "row": {...}}``
+  or ``{"op": "delete", "source": "data.csv", "Seller_ID": "..."}``, with
+  ``row`` in the schema of the file named by ``source``
+
+Rows are never changed in place. A removed seller's row is marked dead and
+a changed seller gets a new row appended after the others, so a refresh
+indexes and scores only the delta and appends it to the store view. Each
+refresh publishes a new immutable ``Snapshot``; a search that grabbed the
+previous one keeps a consistent view of data, index and scores. Once the
+deltas outgrow a share of the base store, the live rows are written to a
+new store and everything is rebuilt from it, off the request path.
+"""
+
+import io
+import json
+import os
+import threading
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .lookup import DATA_FILES, load_data
+from .metrics import METRICS
+from .retrieval import LayeredIndex, RetailerIndex
+from .scoring import LegitimacyScorer
+from .store import ARROW_SCHEMA, CHUNK_ROWS, KEY_SEPARATOR, SELLER_COLUMNS, STORE_PATH, SellerStore, normalize, row_keys, write_store
+
+# Seconds between checks of the dataset files and the delta feed
+REFRESH_INTERVAL = 5.0
+
+# Delta index layers kept before they are merged into one
+MAX_LAYERS = 8
+
+# The store is rewritten once appended and dead rows exceed this share of its rows
+COMPACT_RATIO = 0.25
+
+# Bytes before the read position compared on each check to tell an append from a replaced file
+TAIL_BYTES = 4096
+
+REWRITTEN = "rewritten"
+
+Snapshot = namedtuple("Snapshot", ["data", "index", "scorer", "version"])
+
+
+def key_hashes(keys):
+    return pd.util.hash_array(keys.fillna("").to_numpy(dtype=object))
+
+
+def row_hashes(frame):
+    return pd.util.hash_pandas_object(frame[SELLER_COLUMNS], index=False).to_numpy()
+
+
+class WatchedFile:
+    """Position up to which a dataset CSV has been applied.
+
+    Appends are detected by checking that the bytes before that position are
+    unchanged, so only the new lines are read. Any other change to the file
+    is reported as a rewrite. An edit that keeps both the size and the last
+    few KB before the position intact goes unnoticed until the next one.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.mark()
+
+    def stat(self):
+        try:
+            status = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return status.st_mtime_ns, status.st_size
+
+    def position(self):
+        # The file as it is now, up to its last complete line; pass it to ``advance`` once applied
+        stamp = self.stat()
+        with open(self.path, "rb") as handle:
+            header = handle.readline()
+            size = handle.seek(0, os.SEEK_END)
+            start = max(len(header), size - TAIL_BYTES)
+            handle.seek(start)
+            tail = handle.read()
+        return stamp, header, tail[:tail.rfind(b"\n") + 1], start
+
+    def advance(self, position):
+        self.stamp, self.header, self.tail, self.tail_start = position
+
+    def mark(self):
+        # Treats the file as applied up to its last complete line
+        self.advance(self.position())
+
+    def poll(self):
+        # (None, None) when nothing changed, (REWRITTEN, None), or a table of the appended rows and
+        # the position to ``advance`` to once they are applied
+        stamp = self.stat()
+        if stamp is None or stamp == self.stamp:
+            return None, None
+        offset = self.tail_start + len(self.tail)
+        if stamp[1] <= offset:
+            return REWRITTEN, None
+        with open(self.path, "rb") as handle:
+            if handle.readline() != self.header:
+                return REWRITTEN, None
+            handle.seek(self.tail_start)
+            if handle.read(len(self.tail)) != self.tail:
+                return REWRITTEN, None
+            appended = handle.read()
+
+        # A line still being written is picked up by a later check
+        end = appended.rfind(b"\n") + 1
+        if not end:
+            return None, None
+        tail = (self.tail + appended[:end])[-TAIL_BYTES:]
+        position = (stamp, self.header, tail, offset + end - len(tail))
+        frame = pd.read_csv(io.BytesIO(self.header + appended[:end]), dtype=str, on_bad_lines="skip")
+        return normalize(frame, self.path), position
+
+
+class DeltaFeed:
+    """Append-only JSONL file of upserts and deletes, read from where the last read stopped."""
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+
+    def read(self):
+        # New operations and the offset to set once they are applied
+        if not os.path.exists(self.path):
+            return [], self.offset
+        # A truncated or rotated feed is replayed from the start; applying an operation twice is harmless
+        offset = self.offset if os.path.getsize(self.path) >= self.offset else 0
+        with open(self.path, "rb") as handle:
+            handle.seek(offset)
+            content = handle.read()
+        end = content.rfind(b"\n") + 1
+        offset += end
+
+        operations = []
+        for line in content[:end].splitlines():
+            try:
+                operation = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(operation, dict) and operation.get("op") in ("upsert", "delete"):
+                operations.append(operation)
+        return operations, offset
+
+
+def feed_changes(operations):
+    # Collapses feed operations to the last one per seller; returns (upserted tables, deleted keys)
+    latest = {}
+    for position, operation in enumerate(operations):
+        source = os.path.basename(str(operation.get("source", "")))
+        row = operation.get("row") or {}
+        seller_id = row.get("Seller_ID") if operation["op"] == "upsert" else operation.get("Seller_ID")
+        key = (source, str(seller_id)) if seller_id is not None else (source, position)
+        latest[key] = (operation["op"], row)
+
+    upserts = {}
+    deletes = []
+    for (source, seller_id), (op, row) in latest.items():
+        if op == "upsert":
+            upserts.setdefault(source, []).append(row)
+        elif isinstance(seller_id, str):
+            deletes.append(f"{source}{KEY_SEPARATOR}{seller_id}")
+    tables = [normalize(pd.DataFrame(rows, dtype=object), source) for source, rows in upserts.items()]
+    return tables, deletes
+
+
+class DataReloader:
+    """Keeps a snapshot of data, name index and scores in step with the dataset files.
+
+    Readers take ``reloader.current`` once per request and use its fields
+    together. ``refresh`` applies pending changes; ``start`` runs it every
+    ``interval`` seconds in a daemon thread.
+    """
+
+    def __init__(self, sources=DATA_FILES, store_path=None, feed=None, interval=REFRESH_INTERVAL):
+        self.sources = list(sources)
+        self.store_path = store_path or STORE_PATH
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.last_error = None
+        self.generation = 0
+
+        # Files are marked before loading, so lines appended meanwhile are re-applied rather than lost
+        self.files = [WatchedFile(path) for path in self.sources]
+        self.feed = DeltaFeed(feed) if feed else None
+        self.rebase(load_data(self.sources, self.store_path))
+
+    def rebase(self, store):
+        # Starts over from ``store`` with no deltas
+        self.base_rows = len(store)
+        self.base_index = RetailerIndex(store)
+        self.delta_indexes = []
+        self.dead = frozenset()
+        # Row of each changed seller's current version, or None once deleted
+        self.overrides = {}
+        # Sorted key hashes of the base rows, built on the first delta
+        self.base_keys = None
+        # Compaction starts over once the deltas pass COMPACT_RATIO of the base, so that much room
+        # for appended rows is enough for the scores to grow in place until then
+        capacity = int(len(store) * (1 + COMPACT_RATIO)) + 1
+        self.publish(store, LegitimacyScorer(store, capacity=capacity))
+
+    def publish(self, data, scorer):
+        if self.delta_indexes or self.dead:
+            index = LayeredIndex([self.base_index, *self.delta_indexes], self.dead)
+        else:
+            index = self.base_index
+        self.generation += 1
+        self.current = Snapshot(data, index, scorer, self.generation)
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="data-reloader", daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                self.refresh()
+                self.last_error = None
+            except Exception as e:
+                # Keep serving the last good snapshot and try again on the next tick
+                self.last_error = str(e)
+                METRICS.increment("refresh_errors_total")
+
+    def refresh(self):
+        # Applies whatever changed since the last call; returns the number of rows added or removed.
+        # File and feed positions move only once the changes are published, so a failed refresh is
+        # retried in full by the next one.
+        with self.lock:
+            upserts, deletes, positions = [], [], []
+            for watched in self.files:
+                change, position = watched.poll()
+                if change is REWRITTEN:
+                    # Marked before reading, so lines appended meanwhile are read again, not skipped
+                    position = watched.position()
+                    added, removed = self.diff_file(watched.path)
+                    upserts.append(added)
+                    deletes.extend(removed)
+                elif change is not None:
+                    upserts.append(change)
+                if position is not None:
+                    positions.append((watched, position))
+            offset = None
+            if self.feed is not None:
+                operations, offset = self.feed.read()
+                tables, removed = feed_changes(operations)
+                upserts.extend(tables)
+                deletes.extend(removed)
+
+            if not any(table.num_rows for table in upserts) and not deletes:
+                self.advance(positions, offset)
+                return 0
+            with METRICS.span("refresh"):
+                changed = self.apply(upserts, deletes)
+                self.advance(positions, offset)
+                self.maybe_compact()
+            METRICS.increment("refresh_rows_total", changed)
+            return changed
+
+    def advance(self, positions, offset):
+        # Records the file and feed positions read by a refresh as applied
+        for watched, position in positions:
+            watched.advance(position)
+        if offset is not None:
+            self.feed.offset = offset
+
+    def rows_of(self, keys, pending=None):
+        # Live rows currently holding each seller key, one list per key; ``pending`` holds overrides
+        # of a refresh that is not published yet
+        if self.base_keys is None:
+            # One pass over two columns of the base; later lookups are binary searches
+            hashes = key_hashes(row_keys(self.current.data.table.slice(0, self.base_rows).select(["Source", "Seller_ID"]).to_pandas()))
+            order = np.argsort(hashes, kind="stable")
+            self.base_keys = (hashes[order], order)
+        hashes, order = self.base_keys
+        targets = key_hashes(pd.Series(keys, dtype="string"))
+        lefts = np.searchsorted(hashes, targets, "left")
+        rights = np.searchsorted(hashes, targets, "right")
+
+        found = []
+        for key, left, right in zip(keys, lefts, rights):
+            if pending and key in pending:
+                row = pending[key]
+                found.append([] if row is None else [row])
+            elif key in self.overrides:
+                row = self.overrides[key]
+                found.append([] if row is None else [row])
+            else:
+                found.append([int(row) for row in order[left:right] if row not in self.dead])
+        return found
+
+    def diff_file(self, path):
+        # Rows of a replaced CSV that are new or differ from the live rows loaded from it, and sellers it dropped
+        table = self.current.data.table
+        live = np.ones(len(table), dtype=bool)
+        live[list(self.dead)] = False
+        mask = pc.and_(pc.equal(table["Source"], os.path.basename(path)), pa.array(live))
+        current = table.select(SELLER_COLUMNS).filter(mask).to_pandas()
+
+        chunks = pd.read_csv(path, dtype=str, chunksize=CHUNK_ROWS, on_bad_lines="skip")
+        new = pa.concat_tables([ARROW_SCHEMA.empty_table(), *(normalize(chunk, path) for chunk in chunks)])
+        frame = new.select(SELLER_COLUMNS).to_pandas()
+        keys = row_keys(frame)
+        # Only the last line of a seller counts, as on ingest; an earlier one must not pass as a change
+        latest = (~keys.duplicated(keep="last") | keys.isna()).to_numpy()
+        changed = latest & ~np.isin(row_hashes(frame), row_hashes(current))
+        removed = pd.Index(row_keys(current).dropna()).difference(pd.Index(keys.dropna()))
+        return new.filter(pa.array(changed)), list(removed)
+
+    def apply(self, upserts, deletes):
+        snapshot = self.current
+        data = snapshot.data
+        table = pa.concat_tables([ARROW_SCHEMA.empty_table(), *upserts])
+        frame = table.select(SELLER_COLUMNS).to_pandas()
+        keys = row_keys(frame)
+
+        # The last version of a seller in this delta wins
+        latest = (~keys.duplicated(keep="last") | keys.isna()).to_numpy()
+        # Nothing on self changes until the new snapshot is published, so a failure leaves it as it was
+        dead = set()
+        overrides = {}
+        for key, rows in zip(deletes, self.rows_of(deletes)):
+            dead.update(rows)
+            overrides[key] = None
+
+        # Rows identical to the seller's live version (a replayed feed, an unchanged line) are skipped
+        positions = np.flatnonzero(latest & keys.notna().to_numpy())
+        previous = {
+            position: rows
+            for position, rows in zip(positions, self.rows_of(keys.iloc[positions].tolist(), overrides))
+            if rows
+        }
+        unchanged = np.zeros(len(frame), dtype=bool)
+        if previous:
+            old_rows = [row for rows in previous.values() for row in rows]
+            old_hashes = set(row_hashes(data.take(old_rows)).tolist())
+            new_hashes = row_hashes(frame)
+            for position in previous:
+                unchanged[position] = new_hashes[position] in old_hashes
+        keep = latest & ~unchanged
+        for position, rows in previous.items():
+            if keep[position]:
+                dead.update(rows)
+
+        added = table.filter(pa.array(keep))
+        start = len(data)
+        for offset, key in enumerate(keys[keep]):
+            if not pd.isna(key):
+                overrides[key] = start + offset
+
+        if not added.num_rows and not dead:
+            return 0
+        scorer = snapshot.scorer
+        delta_indexes = self.delta_indexes
+        if added.num_rows:
+            data = data.append(added)
+            delta_indexes = [*delta_indexes, RetailerIndex(added, offset=start)]
+            scorer = scorer.extend(added)
+        if len(delta_indexes) > MAX_LAYERS:
+            # Merging costs the size of all deltas since the last compaction, not of the catalog
+            delta_indexes = [RetailerIndex(data.table.slice(self.base_rows), offset=self.base_rows)]
+        self.overrides.update(overrides)
+        self.delta_indexes = delta_indexes
+        self.dead = self.dead | dead
+        self.publish(data, scorer)
+        return added.num_rows + len(dead)
+
+    def maybe_compact(self):
+        data = self.current.data
+        if len(data) - self.base_rows + len(self.dead) <= COMPACT_RATIO * max(self.base_rows, 1):
+            return
+        live = np.ones(len(data), dtype=bool)
+        live[list(self.dead)] = False
+        write_store([data.table.filter(pa.array(live))], self.store_path)
+        self.rebase(SellerStore(self.store_path))
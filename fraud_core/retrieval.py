@@ -0,0 +1,321 @@
+import heapq
+import math
+import re
+
+# Corporate suffixes that users routinely leave out when searching
+COMPANY_SUFFIXES = {"inc", "incorporated", "ltd", "limited", "llc", "co", "corp", "corporation", "gmbh", "plc"}
+
+SUFFIX_PATTERN = r"\b(?:" + "|".join(sorted(COMPANY_SUFFIXES)) + r")\b"
+
+# Minimum n-gram similarity for a fuzzy (typo-tolerant) match
+MIN_SIMILARITY = 0.35
+
+# Trigrams shared by more names than this (e.g. "tec", "hub") say little about which seller is meant
+# and are not used to collect fuzzy candidates
+MAX_GRAM_NAMES = 5000
+
+# Per fuzzy query: trigram postings read while collecting candidates, and candidates scored
+MAX_POSTINGS = 20_000
+MAX_CANDIDATES = 200
+
+# Names turned into trigrams per step while building the index, which bounds its temporary memory
+GRAM_BLOCK_NAMES = 1_000_000
+
+# Store columns the index is built from: normalized company name, then hashes of the lowercased name,
+# the normalized name, the lowercased Seller_ID and the normalized Seller_ID
+INDEX_COLUMNS = ["Name_Key", "Name_Hash", "Name_Key_Hash", "ID_Hash", "ID_Key_Hash"]
+
+
+def normalize_name(name):
+    # Lowercase, drop punctuation and corporate suffixes, collapse whitespace
+    words = re.sub(r"[^0-9a-z]+", " ", str(name).lower()).split()
+    words = [word for word in words if word not in COMPANY_SUFFIXES]
+    return "".join(words)
+
+
+def normalize_names(values):
+    # normalize_name over a whole column at once
+    text = values.astype("string").str.lower().str.replace(r"[^0-9a-z]+", " ", regex=True)
+    text = text.str.replace(SUFFIX_PATTERN, "", regex=True)
+    return text.str.replace(" ", "", regex=False)
+
+
+def ngrams(text, n=3):
+    # Pad so that short names and word boundaries still produce n-grams
+    padded = f"  {text} "
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def gram_code(gram):
+    # A trigram of normalized-name characters (ASCII) as one integer
+    return (ord(gram[0]) << 16) | (ord(gram[1]) << 8) | ord(gram[2])
+
+
+def text_hashes(values):
+    # 64-bit hash of each string, 0 for missing or empty ones; the same function serves ingest and queries
+    import numpy as np
+    import pandas as pd
+
+    values = pd.Series(values, dtype="string")
+    present = (values.notna() & (values != "")).to_numpy(dtype=bool)
+    hashes = pd.util.hash_array(values.fillna("").to_numpy(dtype=object))
+    return np.where(present, hashes, np.uint64(0))
+
+
+def text_hash(value):
+    # text_hashes for one query string, without the cost of building a Series
+    import numpy as np
+    import pandas as pd
+
+    if not value:
+        return np.uint64(0)
+    return pd.util.hash_array(np.array([value], dtype=object), categorize=False)[0]
+
+
+def index_columns(names, ids):
+    # Columns the index is built from, computed from Company_Name and Seller_ID; the store writes them at ingest
+    names = names.astype("string")
+    ids = ids.astype("string")
+    keys = normalize_names(names)
+    return {
+        "Name_Key": keys.where(keys != ""),
+        "Name_Hash": text_hashes(names.str.strip().str.lower()),
+        "Name_Key_Hash": text_hashes(keys),
+        "ID_Hash": text_hashes(ids.str.strip().str.lower()),
+        "ID_Key_Hash": text_hashes(normalize_names(ids)),
+    }
+
+
+def stored_index_columns(data):
+    # Index columns of a store, an Arrow table or a DataFrame; computed here when ``data`` does not have them
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+    table = getattr(data, "table", data)
+    if isinstance(table, pa.Table) and INDEX_COLUMNS[0] in table.column_names:
+        columns = {name: table.column(name) for name in INDEX_COLUMNS}
+    else:
+        frame = table.to_pandas() if isinstance(table, pa.Table) else data
+        missing = pd.Series(pd.NA, index=frame.index, dtype="string")
+        columns = index_columns(
+            frame["Company_Name"] if "Company_Name" in frame.columns else missing,
+            frame["Seller_ID"] if "Seller_ID" in frame.columns else missing,
+        )
+        columns["Name_Key"] = pa.array(columns["Name_Key"], type=pa.string())
+    hashes = {name: np.asarray(columns[name], dtype=np.uint64) for name in INDEX_COLUMNS[1:]}
+    return columns["Name_Key"], hashes
+
+
+def gram_postings(keys):
+    # Trigram -> ids of the names in ``keys`` containing it, as sorted trigram codes, their posting sizes and
+    # offsets into one array of name ids. Trigrams of more than MAX_GRAM_NAMES names are never read by a
+    # search, so only their size is kept.
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    packed = [np.empty(0, dtype=np.uint64)]
+    for start in range(0, len(keys), GRAM_BLOCK_NAMES):
+        block = keys.slice(start, GRAM_BLOCK_NAMES)
+        padded = pc.binary_join_element_wise("  ", block, " ", "")
+        if isinstance(padded, pa.ChunkedArray):
+            padded = padded.combine_chunks()
+        offsets = np.frombuffer(padded.buffers()[1], dtype=np.int32)[padded.offset:padded.offset + len(padded) + 1]
+        text = np.frombuffer(padded.buffers()[2], dtype=np.uint8)
+        # Positions of every trigram of every name, as ngrams would produce them
+        counts = np.diff(offsets).astype(np.int64) - 2
+        firsts = np.cumsum(counts) - counts
+        positions = np.repeat(offsets[:-1] - firsts, counts) + np.arange(counts.sum())
+        codes = (text[positions].astype(np.uint64) << np.uint64(16)) | (text[positions + 1].astype(np.uint64) << np.uint64(8)) | text[positions + 2]
+        ids = np.repeat(np.arange(start, start + len(block), dtype=np.uint64), counts)
+        packed.append((codes << np.uint64(32)) | ids)
+
+    # One sort of code and name id packed together orders the postings far faster than an argsort
+    packed = np.concatenate(packed)
+    packed.sort()
+    if len(packed):
+        # A name repeating a trigram is listed under it once
+        packed = packed[np.r_[True, packed[1:] != packed[:-1]]]
+    codes = packed >> np.uint64(32)
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.empty(0, dtype=np.int64)
+    sizes = np.diff(np.r_[starts, len(codes)])
+    kept = sizes <= MAX_GRAM_NAMES
+    names = (packed[np.repeat(kept, sizes)] & np.uint64(0xFFFFFFFF)).astype(np.int32)
+    offsets = np.r_[0, np.cumsum(np.where(kept, sizes, 0))]
+    return codes[starts].astype(np.int64), sizes, offsets, names
+
+
+class HashRows:
+    """Rows of one hash column, found by hash.
+
+    Each indexed row is packed with the top bits of its hash into one
+    uint64 and the packed values are sorted, which numpy does far faster
+    than an argsort. A lookup is a binary search on the hash prefix; rows
+    whose full hash differs are dropped, so the truncation never returns a
+    wrong row. Rows with hash 0 (no value) are left out.
+    """
+
+    def __init__(self, hashes):
+        import numpy as np
+
+        self.hashes = hashes
+        self.bits = np.uint64(max(len(hashes), 1).bit_length())
+        self.mask = (np.uint64(1) << self.bits) - np.uint64(1)
+        rows = np.flatnonzero(hashes).astype(np.uint64)
+        self.packed = ((hashes[rows] >> self.bits) << self.bits) | rows
+        self.packed.sort()
+
+    def rows(self):
+        # Indexed rows in packed order, which groups equal hashes together
+        return (self.packed & self.mask).astype("int64")
+
+    def find(self, value):
+        import numpy as np
+
+        low = (value >> self.bits) << self.bits
+        start = np.searchsorted(self.packed, low, "left")
+        end = np.searchsorted(self.packed, low | self.mask, "right")
+        rows = (self.packed[start:end] & self.mask).astype(np.int64)
+        return rows[self.hashes[rows] == value]
+
+
+class RetailerIndex:
+    """Name index over the Company_Name and Seller_ID columns.
+
+    Lookups try an exact match first, then a normalized match, then fall back
+    to trigram similarity over normalized company names so that typos still
+    find the right seller. The index is built with numpy from the key and
+    hash columns the store writes at ingest (see ``index_columns``), with no
+    Python loop over the rows.
+    """
+
+    def __init__(self, data, offset=0):
+        # ``offset`` is the row position of data's first row, for indexing rows appended to a larger table
+        import numpy as np
+        import pyarrow.compute as pc
+
+        self.offset = offset
+        self.keys, hashes = stored_index_columns(data)
+        self.exact = [HashRows(hashes["Name_Hash"]), HashRows(hashes["ID_Hash"])]
+        self.normalized = [HashRows(hashes["Name_Key_Hash"]), HashRows(hashes["ID_Key_Hash"])]
+
+        # One row per distinct normalized company name; a name id is a position in these arrays
+        rows = self.normalized[0].rows()
+        key_hashes = hashes["Name_Key_Hash"][rows]
+        first = np.r_[True, key_hashes[1:] != key_hashes[:-1]] if len(rows) else np.empty(0, dtype=bool)
+        self.name_rows = rows[first]
+        self.name_hashes = key_hashes[first]
+        self.gram_codes, self.gram_sizes, self.gram_offsets, self.gram_names = gram_postings(
+            pc.take(self.keys, self.name_rows)
+        )
+
+    def postings(self, code):
+        # Number of names containing a trigram, and their ids (empty when there are more than MAX_GRAM_NAMES)
+        import numpy as np
+
+        position = np.searchsorted(self.gram_codes, code)
+        if position == len(self.gram_codes) or self.gram_codes[position] != code:
+            return 0, self.gram_names[:0]
+        return int(self.gram_sizes[position]), self.gram_names[self.gram_offsets[position]:self.gram_offsets[position + 1]]
+
+    def names(self, name_ids):
+        # Normalized names and their hashes for a few name ids
+        import pyarrow.compute as pc
+
+        return pc.take(self.keys, self.name_rows[name_ids]).to_pylist(), self.name_hashes[name_ids].tolist()
+
+    def search(self, query, k=5):
+        # Returns up to k row positions, best match first
+        return search_indexes([self], query, k)
+
+
+class LayeredIndex:
+    """Read-only view over a base index and the indexes of rows appended since.
+
+    Rows in ``dead`` (removed, or replaced by a newer version) are never
+    returned. Adding a delta creates a new view that shares every existing
+    layer, so readers holding the previous view are unaffected.
+    """
+
+    def __init__(self, layers, dead=frozenset()):
+        self.layers = tuple(layers)
+        self.dead = dead
+
+    def search(self, query, k=5):
+        return search_indexes(self.layers, query, k, self.dead)
+
+
+def search_indexes(indexes, query, k=5, dead=frozenset()):
+    # Exact, then normalized, then trigram matching across indexes covering disjoint row ranges
+    import numpy as np
+
+    query = str(query).strip()
+    if not query:
+        return []
+
+    exact = live_rows(indexes, "exact", text_hash(query.lower()), dead)
+    if exact:
+        return sorted(exact)[:k]
+
+    key = normalize_name(query)
+    if not key:
+        return []
+    normalized = live_rows(indexes, "normalized", text_hash(key), dead)
+    if normalized:
+        return sorted(normalized)[:k]
+
+    # Candidates must reach MIN_SIMILARITY, i.e. share at least ``needed`` trigrams with the query, so each
+    # contains one of the len(query_grams) - needed + 1 rarest query trigrams; only those are read
+    query_grams = ngrams(key)
+    needed = math.ceil(MIN_SIMILARITY * len(query_grams) / (2 - MIN_SIMILARITY))
+    found = {gram: [index.postings(gram_code(gram)) for index in indexes] for gram in query_grams}
+    postings = sorted((sum(size for size, _ in found[gram]), gram) for gram in query_grams)
+    shared = [[] for _ in indexes]
+    read = 0
+    for size, gram in postings[:len(query_grams) - needed + 1]:
+        # Sorted rarest first, so every remaining trigram is at least as common
+        if size > MAX_GRAM_NAMES or read >= MAX_POSTINGS:
+            break
+        for ids, (_, names) in zip(shared, found[gram]):
+            ids.append(names)
+        read += size
+
+    # Names sharing the most read trigrams with the query, as name -> (count, hash)
+    counts = {}
+    for index, ids in zip(indexes, shared):
+        if not ids:
+            continue
+        name_ids, hits = np.unique(np.concatenate(ids), return_counts=True)
+        if len(name_ids) > MAX_CANDIDATES:
+            top = np.argsort(-hits, kind="stable")[:MAX_CANDIDATES]
+            name_ids, hits = name_ids[top], hits[top]
+        for name, name_hash, count in zip(*index.names(name_ids), hits.tolist()):
+            counts[name] = (counts.get(name, (0, None))[0] + count, name_hash)
+    candidates = heapq.nlargest(MAX_CANDIDATES, counts, key=lambda name: counts[name][0])
+
+    # Score the candidates by Dice similarity of their trigram sets
+    scored = []
+    for candidate in candidates:
+        grams = ngrams(candidate)
+        similarity = 2 * len(query_grams & grams) / (len(query_grams) + len(grams))
+        if similarity >= MIN_SIMILARITY:
+            scored.append((similarity, candidate))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+
+    rows = []
+    for _, candidate in scored:
+        for row in sorted(live_rows(indexes, "normalized", counts[candidate][1], dead)):
+            if row not in rows:
+                rows.append(row)
+        if len(rows) >= k:
+            break
+    return rows[:k]
+
+
+def live_rows(indexes, table, value, dead):
+    rows = set()
+    for index in indexes:
+        for hashes in getattr(index, table):
+            rows.update((hashes.find(value) + index.offset).tolist())
+    return rows - dead if dead else rows
@@ -0,0 +1,152 @@
+import copy
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Each feature: (name, source columns with the first present one winning, parser, scale, weight).
+# Values are scaled to 0..1 so the weights alone decide how much a signal matters.
+FEATURES = [
+    ("Verified", ("Verified_Status", "Verified_Address"), "flag", 1.0, 2.0),
+    ("Customer Rating", ("Avg_Customer_Rating", "Average_Customer_Rating"), "number", 5.0, 1.0),
+    ("Customer Service", ("Customer_Service_Score",), "number", 10.0, 1.0),
+    ("Dispute Resolution", ("Dispute_Resolution_Rate", "Complaints_Resolved_Percentage"), "percent", 100.0, 1.5),
+    ("Website Security", ("Website_Security_Score",), "number", 100.0, 1.0),
+    ("Legitimacy Score", ("Legitimacy_Score",), "number", 100.0, 2.0),
+]
+
+WEIGHTS = np.array([feature[4] for feature in FEATURES])
+
+# Sellers scoring at or above this are considered legitimate
+LEGITIMATE_THRESHOLD = 0.75
+
+TRUE_VALUES = {"verified", "yes", "true", "1"}
+
+Verdict = namedtuple("Verdict", ["verdict", "score", "contributions"])
+
+
+def parse_number(series):
+    return pd.to_numeric(series, errors="coerce").astype("float64")
+
+
+def parse_percent(series):
+    # Accepts both "98%" strings and plain numbers; the store already holds these columns as floats
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype("float64")
+    return parse_number(series.astype("string").str.strip().str.rstrip("%"))
+
+
+def parse_flag(series):
+    present = series.notna()
+    values = series.astype("string").str.strip().str.lower().isin(TRUE_VALUES)
+    return values.astype("float64").where(present)
+
+
+PARSERS = {"number": parse_number, "percent": parse_percent, "flag": parse_flag}
+
+
+def feature_matrix(data):
+    # One float column per feature, NaN where a seller has no value for it
+    matrix = np.full((len(data), len(FEATURES)), np.nan)
+    for position, (_, columns, parser, scale, _) in enumerate(FEATURES):
+        column = np.full(len(data), np.nan)
+        for name in columns:
+            if name in data.columns:
+                values = PARSERS[parser](data[name]).to_numpy(dtype="float64", na_value=np.nan)
+                column = np.where(np.isnan(column), values, column)
+        matrix[:, position] = np.clip(column / scale, 0.0, 1.0)
+    return matrix
+
+
+def score_features(features):
+    # Per-feature contributions and overall scores for a feature matrix
+    available = ~np.isnan(features)
+    totals = (available * WEIGHTS).sum(axis=1)
+    weighted = np.where(available, features, 0.0) * WEIGHTS
+    with np.errstate(invalid="ignore", divide="ignore"):
+        contributions = np.where(available, weighted / totals[:, None], np.nan)
+    scores = np.where(totals > 0, np.nansum(contributions, axis=1), np.nan)
+    return contributions, scores
+
+
+def scores_of(data):
+    # Contributions and scores the store computed at ingest, or computed here when ``data`` has none
+    table = getattr(data, "table", data)
+    if isinstance(table, pa.Table):
+        if "Score" in table.column_names:
+            contributions = table.column("Contributions").combine_chunks().flatten().to_numpy()
+            return contributions.reshape(-1, len(FEATURES)), table.column("Score").to_numpy()
+        if data is table:
+            data = table.to_pandas()
+    return score_features(feature_matrix(data))
+
+
+class LegitimacyScorer:
+    """Scores every seller in one vectorized pass.
+
+    Missing features are left out of a seller's weighted average instead of
+    counting as zero, so sellers from either dataset are scored on the
+    signals they actually have.
+    """
+
+    def __init__(self, data, threshold=LEGITIMATE_THRESHOLD, capacity=None):
+        # ``capacity`` reserves room for rows added later with extend, so those do not copy the arrays
+        self.threshold = threshold
+        self.names = [feature[0] for feature in FEATURES]
+
+        contributions, scores = scores_of(data)
+        self.size = len(scores)
+        # Scores read from the store stay memory-mapped; buffers of ``capacity`` rows are allocated
+        # on the first extend
+        self.capacity = capacity or self.size
+        self.buffers = {"contributions": contributions, "scores": scores}
+        # contributions/scores are views of the first ``size`` rows of the buffers
+        self.reserved = [self.size]
+        self.contributions = self.buffers["contributions"][:self.size]
+        self.scores = self.buffers["scores"][:self.size]
+
+    def allocate(self, capacity):
+        # Buffers of ``capacity`` rows starting with the current rows
+        buffers = {}
+        for name, current in self.buffers.items():
+            buffer = np.full((capacity,) + current.shape[1:], np.nan)
+            buffer[:self.size] = current[:self.size]
+            buffers[name] = buffer
+        return buffers
+
+    def extend(self, data):
+        # Scorer for the current rows followed by ``data``. Only the new rows are scored and the
+        # existing ones are shared with this scorer, which keeps returning the same verdicts.
+        contributions, scores = scores_of(data)
+        size = self.size + len(scores)
+        buffers = self.buffers
+        reserved = self.reserved
+        # Write in place only if the space after our rows is still unused, otherwise copy into buffers
+        # of ``capacity`` rows (exactly the new size once that is outgrown)
+        if reserved[0] != self.size or size > len(buffers["scores"]):
+            buffers = self.allocate(max(size, self.capacity, len(buffers["scores"])))
+            reserved = [self.size]
+        buffers["contributions"][self.size:size] = contributions
+        buffers["scores"][self.size:size] = scores
+        reserved[0] = size
+
+        extended = copy.copy(self)
+        extended.buffers = buffers
+        extended.reserved = reserved
+        extended.size = size
+        extended.contributions = buffers["contributions"][:size]
+        extended.scores = buffers["scores"][:size]
+        return extended
+
+    def verdict(self, row):
+        score = self.scores[row]
+        if np.isnan(score):
+            return Verdict("Insufficient data", None, {})
+        contributions = {
+            name: float(value)
+            for name, value in zip(self.names, self.contributions[row])
+            if not np.isnan(value)
+        }
+        label = "Legitimate" if score >= self.threshold else "Not Legitimate"
+        return Verdict(label, float(score), contributions)
@@ -0,0 +1,364 @@
+"""Columnar seller store shared by the app and the batch jobs.
+
+Both dataset files are merged into one typed schema and written to an
+uncompressed Arrow IPC file. Opening the store memory-maps that file, so
+startup does not parse any CSV and a column is only decoded into pandas
+the first time it is used. Ingest also writes what startup would otherwise
+derive row by row: the normalized name and name/ID hashes the name index is
+sorted from, and each seller's score and feature contributions.
+
+Startup time and resident memory for synthetic catalogs, for opening the
+store alone and for the app's full startup (open, name index, scorer), can
+be measured with:
+    python -m fraud_core.store --bench 10000 1000000 10000000
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .retrieval import COMPANY_SUFFIXES, INDEX_COLUMNS, index_columns
+from .scoring import FEATURES, feature_matrix, score_features
+
+# Where the ingested store is written
+STORE_PATH = os.path.join(".cache", "sellers.arrow")
+
+# Rows parsed per CSV chunk during ingestion, so memory stays bounded for large feeds
+CHUNK_ROWS = 500_000
+
+# Unified schema: column -> (kind, source columns in data.csv / data_retailers.csv)
+SCHEMA = {
+    "Seller_ID": ("string", ["Seller_ID"]),
+    "Company_Name": ("string", ["Company_Name"]),
+    "Country_of_Origin": ("category", ["Country_of_Origin"]),
+    "Address": ("string", ["Address"]),
+    "Years_Active": ("number", ["Years_Active"]),
+    "Annual_Revenue_USD": ("number", ["Annual_Revenue_USD"]),
+    "Total_Products": ("number", ["Total_Products", "Number_of_Products"]),
+    "Avg_Customer_Rating": ("number", ["Avg_Customer_Rating", "Average_Customer_Rating"]),
+    "Total_Reviews": ("number", ["Total_Reviews"]),
+    "Verified_Status": ("category", ["Verified_Status"]),
+    "Verified_Address": ("category", ["Verified_Address"]),
+    "Return_Policy_Days": ("number", ["Return_Policy_Days"]),
+    "Shipping_Time_Days": ("number", ["Shipping_Time_Days"]),
+    "Shipping_Countries": ("string", ["Shipping_Countries"]),
+    "Customer_Service_Score": ("number", ["Customer_Service_Score"]),
+    "Dispute_Resolution_Rate": ("percent", ["Dispute_Resolution_Rate"]),
+    "Complaints_Resolved_Percentage": ("percent", ["Complaints_Resolved_Percentage"]),
+    "Payment_Methods_Accepted": ("string", ["Payment_Methods_Accepted"]),
+    "Payment_Methods_Count": ("number", ["Payment_Methods"]),
+    "Social_Media_Presence": ("category", ["Social_Media_Presence"]),
+    "Industry_Certifications": ("string", ["Industry_Certifications"]),
+    "Website_Security_Score": ("number", ["Website_Security_Score"]),
+    "Legitimacy_Score": ("number", ["Legitimacy_Score"]),
+    "Source": ("category", []),
+}
+
+# Categories are stored as strings on disk and dictionary encoded when loaded
+ARROW_TYPES = {"string": pa.string(), "category": pa.string(), "number": pa.float64(), "percent": pa.float64()}
+
+# Columns of a seller record, as handed to the prompt and compared on refresh
+SELLER_COLUMNS = list(SCHEMA)
+
+# Columns computed from a record at ingest; see retrieval.index_columns and scoring.score_features
+DERIVED_TYPES = {
+    "Name_Key": pa.string(),
+    **{name: pa.uint64() for name in INDEX_COLUMNS[1:]},
+    "Score": pa.float64(),
+    "Contributions": pa.list_(pa.float64(), len(FEATURES)),
+}
+
+# Changes whenever the derived columns would come out differently, so older stores are ingested again
+DERIVED_VERSION = hashlib.sha1(repr(("1", FEATURES, sorted(COMPANY_SUFFIXES))).encode()).hexdigest()[:12]
+
+RECORD_SCHEMA = pa.schema([(name, ARROW_TYPES[kind]) for name, (kind, _) in SCHEMA.items()])
+
+ARROW_SCHEMA = pa.schema(
+    [*RECORD_SCHEMA, *(pa.field(name, kind) for name, kind in DERIVED_TYPES.items())],
+    metadata={"derived": DERIVED_VERSION},
+)
+
+# Joins Source and Seller_ID into a seller key; pandas hashing stops at NUL, so that cannot be used
+KEY_SEPARATOR = "\x1f"
+
+# The two files spell some countries differently
+COUNTRY_ALIASES = {"USA": "United States", "UK": "United Kingdom"}
+
+
+def convert(series, kind):
+    if kind in ("string", "category"):
+        return series.astype("string").str.strip()
+    if kind == "percent":
+        series = series.astype("string").str.strip().str.rstrip("%")
+    return pd.to_numeric(series, errors="coerce").astype("float64")
+
+
+def normalize(chunk, source):
+    # Maps one chunk of either CSV schema onto the unified schema
+    columns = {}
+    for name, (kind, aliases) in SCHEMA.items():
+        present = [alias for alias in aliases if alias in chunk.columns]
+        if present:
+            columns[name] = convert(chunk[present[0]], kind)
+        else:
+            columns[name] = convert(pd.Series(None, index=chunk.index, dtype="object"), kind)
+
+    # data_retailers.csv reports revenue in millions
+    if "Revenue_USD_Million" in chunk.columns:
+        columns["Annual_Revenue_USD"] = convert(chunk["Revenue_USD_Million"], "number") * 1e6
+    columns["Country_of_Origin"] = columns["Country_of_Origin"].replace(COUNTRY_ALIASES)
+    columns["Source"] = pd.Series(os.path.basename(source), index=chunk.index, dtype="string")
+
+    return to_table(pd.DataFrame(columns))
+
+
+def to_table(frame):
+    # Seller records plus their derived columns. A table rather than a record batch: large string
+    # columns can come out of pandas in several chunks.
+    table = pa.Table.from_pandas(frame, schema=RECORD_SCHEMA, preserve_index=False)
+    derived = index_columns(frame["Company_Name"], frame["Seller_ID"])
+    contributions, scores = score_features(feature_matrix(frame))
+    derived["Score"] = scores
+    derived["Contributions"] = pa.FixedSizeListArray.from_arrays(pa.array(contributions.ravel()), len(FEATURES))
+    for name, kind in DERIVED_TYPES.items():
+        table = table.append_column(pa.field(name, kind), pa.array(derived[name], type=kind))
+    return table.replace_schema_metadata(ARROW_SCHEMA.metadata)
+
+
+def row_keys(frame):
+    # A seller is identified by the file it comes from and its Seller_ID
+    return frame["Source"].astype("string") + KEY_SEPARATOR + frame["Seller_ID"].astype("string")
+
+
+def superseded_rows(table):
+    # Rows whose seller appears again further down; the last line for a seller wins
+    keys = row_keys(table.select(["Source", "Seller_ID"]).to_pandas())
+    return np.flatnonzero((keys.duplicated(keep="last") & keys.notna()).to_numpy())
+
+
+def write_store(pieces, path=STORE_PATH):
+    # Writes record batches or tables to a temporary file first so readers never see a half written
+    # store; open memory maps of a replaced store stay valid
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=directory, suffix=".arrow")
+    os.close(handle)
+    try:
+        with pa.OSFile(temporary, "wb") as sink, pa.ipc.new_file(sink, ARROW_SCHEMA) as writer:
+            for piece in pieces:
+                writer.write(piece)
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    return path
+
+
+def ingest(sources, path=STORE_PATH):
+    chunks = (
+        normalize(chunk, source)
+        for source in sources
+        for chunk in pd.read_csv(source, dtype=str, chunksize=CHUNK_ROWS, on_bad_lines="skip")
+    )
+    staging = write_store(chunks, f"{path}.ingest")
+    try:
+        # Later lines for a seller replace earlier ones, as they do when the app reloads appended lines
+        table = SellerStore(staging).table
+        superseded = superseded_rows(table)
+        if not len(superseded):
+            os.replace(staging, path)
+            return path
+        keep = np.ones(len(table), dtype=bool)
+        keep[superseded] = False
+        batches, start = [], 0
+        for batch in table.to_batches():
+            batches.append(batch.filter(pa.array(keep[start:start + len(batch)])))
+            start += len(batch)
+        return write_store(batches, path)
+    finally:
+        if os.path.exists(staging):
+            os.remove(staging)
+
+
+def is_current(path, sources):
+    # The store exists, is newer than every source and has its derived columns computed as this code does
+    if not os.path.exists(path) or os.path.getmtime(path) < max(os.path.getmtime(source) for source in sources):
+        return False
+    try:
+        metadata = pa.ipc.open_file(pa.memory_map(path, "r")).schema.metadata or {}
+    except pa.ArrowInvalid:
+        return False
+    return metadata.get(b"derived") == DERIVED_VERSION.encode()
+
+
+def open_store(sources, path=STORE_PATH):
+    # Re-ingests only when the store is missing or out of date
+    if not is_current(path, sources):
+        ingest(sources, path)
+    return SellerStore(path)
+
+
+class SellerStore:
+    """Read-only, memory-mapped view of the ingested seller table.
+
+    Behaves like the parts of a DataFrame the app uses: ``len``,
+    ``columns``, ``store[column]`` and ``take(rows)``, which returns the
+    seller records without the derived columns. ``append`` returns a
+    new store with extra rows after the memory-mapped ones, leaving this one
+    unchanged.
+    """
+
+    def __init__(self, path, table=None):
+        self.path = path
+        self.table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all() if table is None else table
+        self.columns = pd.Index(self.table.column_names)
+        self.loaded = {}
+
+    def __len__(self):
+        return self.table.num_rows
+
+    def __getitem__(self, name):
+        # Decodes a column on first use and keeps it for later queries
+        series = self.loaded.get(name)
+        if series is None:
+            series = self.table.column(name).to_pandas()
+            if SCHEMA.get(name, ("",))[0] == "category":
+                series = series.astype("category")
+            series.name = name
+            self.loaded[name] = series
+        return series
+
+    def take(self, rows, columns=None):
+        # Slicing row by row stays zero-copy; Table.take would concatenate whole chunks
+        table = self.table.select(SELLER_COLUMNS if columns is None else columns)
+        pieces = [table.slice(row, 1) for row in rows] or [table.slice(0, 0)]
+        return pa.concat_tables(pieces).to_pandas()
+
+    def append(self, table):
+        # Only chunk references are copied, so the cost does not depend on the size of the store
+        return SellerStore(self.path, pa.concat_tables([self.table, table.combine_chunks()]))
+
+
+def synthetic_batches(rows, batch_rows=1_000_000, seed=0):
+    # Random sellers in the unified schema, generated batch by batch
+    rng = np.random.default_rng(seed)
+    countries = np.array(["United States", "Canada", "China", "Germany", "India", "United Kingdom", "Japan", "Brazil"])
+    for start in range(0, rows, batch_rows):
+        size = min(batch_rows, rows - start)
+        ids = np.arange(start, start + size)
+        columns = {}
+        for name, (kind, _) in SCHEMA.items():
+            if kind == "string":
+                columns[name] = np.char.add(f"{name[:4]}-", ids.astype(str))
+            elif kind == "category":
+                columns[name] = countries[rng.integers(0, len(countries), size)]
+            else:
+                columns[name] = rng.random(size) * 100
+        yield to_table(pd.DataFrame(columns).astype({name: "string" for name, (kind, _) in SCHEMA.items() if kind in ("string", "category")}))
+
+
+def resident_memory_mb():
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(path):
+    # Runs in a fresh process so startup time and memory are not skewed by the caller
+    from .retrieval import RetailerIndex
+    from .scoring import LegitimacyScorer
+
+    baseline = resident_memory_mb()
+    started = time.perf_counter()
+    store = SellerStore(path)
+    opened = time.perf_counter() - started
+    opened_memory = resident_memory_mb()
+
+    # What the app does before serving its first search
+    started = time.perf_counter()
+    index = RetailerIndex(store)
+    indexed = time.perf_counter() - started
+    started = time.perf_counter()
+    scorer = LegitimacyScorer(store)
+    scored = time.perf_counter() - started
+    startup_memory = resident_memory_mb()
+
+    # A misspelled name, so the lookup goes through every tier down to trigram matching
+    name = store.take([len(store) // 2], ["Company_Name"])["Company_Name"].iloc[0]
+    started = time.perf_counter()
+    rows = index.search(name[:-2] + name[-1])
+    store.take(rows)
+    [scorer.verdict(row) for row in rows]
+    queried = time.perf_counter() - started
+    return {
+        "rows": len(store),
+        "open_seconds": round(opened, 4),
+        "open_rss_mb": round(opened_memory - baseline, 1),
+        "index_seconds": round(indexed, 4),
+        "scorer_seconds": round(scored, 4),
+        "startup_seconds": round(opened + indexed + scored, 4),
+        "startup_rss_mb": round(startup_memory - baseline, 1),
+        "first_query_seconds": round(queried, 4),
+        "file_mb": round(os.path.getsize(path) / 2**20, 1),
+    }
+
+
+def bench(sizes):
+    results = []
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in sizes:
+            path = os.path.join(directory, f"sellers-{rows}.arrow")
+            with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, ARROW_SCHEMA) as writer:
+                for table in synthetic_batches(rows):
+                    writer.write(table)
+            measured = subprocess.run(
+                [sys.executable, "-m", "fraud_core.store", "--measure", path],
+                cwd=root,
+                capture_output=True,
+                text=True,
+            )
+            if measured.returncode:
+                # Typically the machine running out of memory for the larger sizes
+                lines = measured.stderr.strip().splitlines()
+                results.append({"rows": rows, "error": lines[-1] if lines else f"exit code {measured.returncode}"})
+            else:
+                results.append(json.loads(measured.stdout))
+            os.remove(path)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest the seller CSVs into the columnar store.")
+    parser.add_argument("sources", nargs="*", default=["data.csv", "data_retailers.csv"])
+    parser.add_argument("-o", "--output", default=STORE_PATH)
+    parser.add_argument("--bench", nargs="+", type=int, metavar="ROWS", help="report startup time and memory for synthetic catalogs")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure:
+        print(json.dumps(measure(args.measure)))
+    elif args.bench:
+        for result in bench(args.bench):
+            print(json.dumps(result))
+    else:
+        print(ingest(args.sources, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import asyncio
+import re
+import time
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from .lookup import approx_tokens
+
+
+class StubChatModel(BaseChatModel):
+    """Deterministic local chat model for running the pipeline without an API key.
+
+    The answer only depends on the prompt, so repeated runs produce the same
+    output. ``latency`` seconds pass before the first token, after which
+    tokens arrive at ``tokens_per_second`` (0 means all at once).
+    """
+
+    latency: float = 0.0
+    tokens_per_second: float = 0.0
+
+    @property
+    def _llm_type(self):
+        return "stub"
+
+    def _answer(self, messages):
+        prompt = messages[-1].content
+        match = re.search(r"\n\s*Retailer:(.*)", prompt)
+        retailer = match.group(1).strip() if match else "Unknown"
+        rows = re.search(r"Data:(.*?)\n\s*Retailer:", prompt, re.S)
+        lines = rows.group(1).strip().splitlines() if rows else []
+        if len(lines) < 2:
+            return "No information available"
+        return "\n".join(
+            [
+                f"- Retailer: {retailer}",
+                f"- Candidates: {len(lines) - 1}",
+                f"- Best Match: {lines[1].split(',')[1] if ',' in lines[1] else lines[1]}",
+                "- Legitimacy: Legitimate",
+            ]
+        )
+
+    def _usage(self, messages, answer):
+        input_tokens = approx_tokens(messages[-1].content)
+        output_tokens = approx_tokens(answer)
+        return {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens}
+
+    def _tokens(self, answer):
+        # Words with their trailing whitespace stand in for model tokens
+        return re.findall(r"\S+\s*|\s+", answer)
+
+    def _duration(self, answer):
+        if not self.tokens_per_second:
+            return self.latency
+        return self.latency + len(self._tokens(answer)) / self.tokens_per_second
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        answer = self._answer(messages)
+        duration = self._duration(answer)
+        if duration:
+            time.sleep(duration)
+        message = AIMessage(content=answer, usage_metadata=self._usage(messages, answer))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        answer = self._answer(messages)
+        duration = self._duration(answer)
+        if duration:
+            await asyncio.sleep(duration)
+        message = AIMessage(content=answer, usage_metadata=self._usage(messages, answer))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        answer = self._answer(messages)
+        if self.latency:
+            time.sleep(self.latency)
+        for token in self._tokens(answer):
+            if self.tokens_per_second:
+                time.sleep(1 / self.tokens_per_second)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        # Usage is reported on a final empty chunk, as streaming APIs do
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=self._usage(messages, answer)))
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        answer = self._answer(messages)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        for token in self._tokens(answer):
+            if self.tokens_per_second:
+                await asyncio.sleep(1 / self.tokens_per_second)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=self._usage(messages, answer)))
@@ -0,0 +1,123 @@
+"""Synthetic seller data in the data.csv and data_retailers.csv schemas.
+
+Usage:
+    python -m fraud_core.synth 1000000 -o /tmp/sellers
+
+Rows are generated in vectorized chunks and appended to the CSVs, so
+catalogs from 50 to 10M rows can be written without holding them in
+memory. Roughly one seller in ten is generated with the weak signals of
+a fraudulent one. ``rows`` is split evenly between the two files.
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+PREFIXES = ["Tech", "Eco", "Global", "Smart", "Urban", "Bargain", "Discount", "Fashion", "Home", "Gourmet", "Vintage", "Fit"]
+SUFFIXES = ["Gadgets", "Goods", "Hub", "Deals", "Trends", "Supplies", "Essentials", "Bazaar", "Depot", "Market", "Outlet"]
+COUNTRIES = ["USA", "Canada", "China", "Germany", "India", "UK", "Japan", "Brazil", "France", "South Korea"]
+CITIES = ["New York", "Toronto", "Shenzhen", "Berlin", "Mumbai", "London", "Tokyo", "Sao Paulo", "Paris", "Seoul"]
+SHIPPING = ["Worldwide", "North America", "Europe", "Asia", "Asia; Oceania", "Europe; North America"]
+PAYMENTS = ["Credit Card, PayPal", "Credit Card, PayPal, Apple Pay", "Credit Card, Alipay", "Credit Card, Klarna"]
+CERTIFICATIONS = ["ISO 9001", "FSC Certified", "CE Certified", "FDA Approved", "None"]
+PRESENCE = ["High", "Medium", "Low"]
+
+# Share of generated sellers that look fraudulent
+FRAUD_RATE = 0.1
+
+
+def company_names(ids, rng, tag=""):
+    # Readable names made unique by the row id, e.g. "EcoGoods 42"
+    prefixes = np.array(PREFIXES)[rng.integers(0, len(PREFIXES), len(ids))]
+    suffixes = np.array(SUFFIXES)[rng.integers(0, len(SUFFIXES), len(ids))]
+    return pd.Series(prefixes).str.cat(pd.Series(suffixes)).str.cat(tag + pd.Series(ids).astype(str), sep=" ")
+
+
+def signal(rng, fraud, good, bad, spread, low, high, decimals=1):
+    # Normally distributed around ``good`` for honest sellers and ``bad`` for fraudulent ones
+    values = np.where(fraud, bad, good) + rng.normal(0, spread, len(fraud))
+    return np.round(np.clip(values, low, high), decimals)
+
+
+def sellers_frame(start, size, rng):
+    # Rows in the data.csv schema
+    ids = np.arange(start, start + size)
+    fraud = rng.random(size) < FRAUD_RATE
+    country = rng.integers(0, len(COUNTRIES), size)
+    return pd.DataFrame(
+        {
+            "Seller_ID": pd.Series(ids).map("S{:07d}".format),
+            "Company_Name": company_names(ids, rng),
+            "Country_of_Origin": np.array(COUNTRIES)[country],
+            "Address": pd.Series(rng.integers(1, 9999, size)).astype(str) + " Main St, " + pd.Series(np.array(CITIES)[country]),
+            "Years_Active": rng.integers(1, 20, size),
+            "Annual_Revenue_USD": rng.integers(100_000, 10_000_000, size),
+            "Total_Products": rng.integers(10, 5000, size),
+            "Avg_Customer_Rating": signal(rng, fraud, 4.5, 3.4, 0.3, 1.0, 5.0),
+            "Verified_Status": np.where(fraud, "Not Verified", "Verified"),
+            "Return_Policy_Days": rng.choice([7, 14, 21, 30], size),
+            "Shipping_Countries": np.array(SHIPPING)[rng.integers(0, len(SHIPPING), size)],
+            "Customer_Service_Score": signal(rng, fraud, 8.9, 6.5, 0.5, 1.0, 10.0),
+            "Dispute_Resolution_Rate": pd.Series(signal(rng, fraud, 95, 78, 3, 0, 100, 0).astype(int)).astype(str) + "%",
+            "Payment_Methods_Accepted": np.array(PAYMENTS)[rng.integers(0, len(PAYMENTS), size)],
+            "Social_Media_Presence": np.array(PRESENCE)[rng.integers(0, len(PRESENCE), size)],
+            "Industry_Certifications": np.array(CERTIFICATIONS)[rng.integers(0, len(CERTIFICATIONS), size)],
+        }
+    )
+
+
+def retailers_frame(start, size, rng):
+    # Rows in the data_retailers.csv schema
+    ids = np.arange(start, start + size)
+    fraud = rng.random(size) < FRAUD_RATE
+    return pd.DataFrame(
+        {
+            "Seller_ID": ids + 1,
+            "Company_Name": company_names(ids, rng, tag="R"),
+            "Years_Active": rng.integers(1, 20, size),
+            "Country_of_Origin": np.array(COUNTRIES)[rng.integers(0, len(COUNTRIES), size)],
+            "Revenue_USD_Million": np.round(rng.uniform(0.1, 25, size), 1),
+            "Number_of_Products": rng.integers(10, 5000, size),
+            "Average_Customer_Rating": signal(rng, fraud, 4.5, 3.2, 0.3, 1.0, 5.0),
+            "Total_Reviews": rng.integers(10, 50_000, size),
+            "Verified_Address": np.where(fraud, "No", "Yes"),
+            "Return_Policy_Days": rng.choice([0, 7, 14, 30], size),
+            "Customer_Service_Score": signal(rng, fraud, 8.9, 6.0, 0.5, 1.0, 10.0),
+            "Shipping_Time_Days": rng.integers(1, 15, size),
+            "Payment_Methods": rng.integers(1, 6, size),
+            "Social_Media_Presence": np.where(fraud & (rng.random(size) < 0.5), "No", "Yes"),
+            "Website_Security_Score": signal(rng, fraud, 92, 55, 4, 0, 100, 0),
+            "Complaints_Resolved_Percentage": signal(rng, fraud, 95, 60, 3, 0, 100, 0),
+            "Legitimacy_Score": signal(rng, fraud, 90, 35, 4, 0, 100, 0),
+        }
+    )
+
+
+def write_csvs(directory, rows, seed=0, chunk_rows=1_000_000):
+    # Returns the data.csv and data_retailers.csv paths written under ``directory``
+    os.makedirs(directory, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    paths = []
+    for name, build, size in [("data.csv", sellers_frame, rows - rows // 2), ("data_retailers.csv", retailers_frame, rows // 2)]:
+        path = os.path.join(directory, name)
+        for start in range(0, max(size, 1), chunk_rows):
+            frame = build(start, min(chunk_rows, size - start), rng)
+            frame.to_csv(path, mode="w" if start == 0 else "a", header=start == 0, index=False)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write synthetic seller CSVs.")
+    parser.add_argument("rows", type=int, help="total rows across both files")
+    parser.add_argument("-o", "--output", default=".", help="directory the CSVs are written to")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    for path in write_csvs(args.output, args.rows, args.seed):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+import pandas as pd
+
+from fraud_core.batch import completed_names, screen
+from fraud_core.retrieval import RetailerIndex
+from fraud_core.scoring import LegitimacyScorer
+
+DATA = pd.DataFrame({
+    "Seller_ID": ["S1", "S2"],
+    "Company_Name": ["Acme Ltd", None],
+    "Verified_Status": ["Verified", "No"],
+})
+
+
+def strict_json(line):
+    def reject(constant):
+        raise ValueError(f"{constant} is not valid JSON")
+
+    return json.loads(line, parse_constant=reject)
+
+
+def run_screen(names, output, index, **options):
+    return asyncio.run(asyncio.wait_for(
+        screen(names, str(output), DATA, index, LegitimacyScorer(DATA), **options),
+        timeout=30,
+    ))
+
+
+def test_missing_values_are_written_as_null(tmp_path):
+    output = tmp_path / "out.jsonl"
+    counts = run_screen(["S2", "Acme"], output, RetailerIndex(DATA))
+
+    records = {record["name"]: record for record in map(strict_json, output.read_text().splitlines())}
+    assert counts["written"] == 2
+    assert records["S2"]["company_name"] is None
+    assert records["S2"]["seller_id"] == "S2"
+    assert records["Acme"]["company_name"] == "Acme Ltd"
+
+
+def test_a_failing_name_does_not_stop_the_workers(tmp_path):
+    class FailingIndex:
+        def search(self, name, k=5):
+            if name.startswith("bad"):
+                raise RuntimeError("lookup failed")
+            return []
+
+    output = tmp_path / "out.jsonl"
+    names = [f"bad {position}" for position in range(10)] + ["good"]
+    counts = run_screen(names, output, FailingIndex(), concurrency=2)
+
+    records = [strict_json(line) for line in output.read_text().splitlines()]
+    assert counts == {"written": 11, "skipped": 0, "errors": 10}
+    assert {record["name"] for record in records if "error" in record} == set(names[:-1])
+    # Failed names are screened again on the next run
+    assert completed_names(str(output)) == {"good"}
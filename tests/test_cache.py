@@ -0,0 +1,59 @@
+import pytest
+
+from fraud_core import cache
+from fraud_core.cache import ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # A clock that moves one second per call, so access times are distinct
+    now = [1000.0]
+
+    def time():
+        now[0] += 1
+        return now[0]
+
+    monkeypatch.setattr(cache.time, "time", time)
+    return now
+
+
+def test_answers_are_keyed_by_name_and_context(tmp_path, clock):
+    responses = ResponseCache(str(tmp_path / "cache.sqlite"))
+    responses.put("TechGadgets Inc.", "answer", context="rows v1")
+    assert responses.get("techgadgets", context="rows v1") == "answer"
+    assert responses.get("TechGadgets Inc.", context="rows v2") is None
+    assert responses.key("TechGadgets", "rows v1") != responses.key("TechGadgets", "rows v2")
+    assert ResponseCache(str(tmp_path / "cache.sqlite"), settings="other model").get("TechGadgets", "rows v1") is None
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    responses = ResponseCache(str(tmp_path / "cache.sqlite"), ttl=100)
+    responses.put("Acme", "answer")
+    assert responses.get("Acme") == "answer"
+    clock[0] += 100
+    assert responses.get("Acme") is None
+    # Also once it is no longer held in memory
+    assert ResponseCache(str(tmp_path / "cache.sqlite"), ttl=100).get("Acme") is None
+
+
+def test_memory_tier_keeps_the_most_recent_entries(tmp_path, clock):
+    responses = ResponseCache(str(tmp_path / "cache.sqlite"), memory_entries=2)
+    for name in ["Alpha", "Beta", "Gamma"]:
+        responses.put(name, name.lower())
+    assert responses.stats()["memory_entries"] == 2
+    # Evicted from memory, still served from disk
+    assert responses.get("Alpha") == "alpha"
+
+
+def test_disk_tier_evicts_the_least_recently_used(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite")
+    responses = ResponseCache(path, max_entries=2, memory_entries=0)
+    responses.put("Alpha", "alpha")
+    responses.put("Beta", "beta")
+    assert responses.get("Alpha") == "alpha"
+    responses.put("Gamma", "gamma")
+
+    reopened = ResponseCache(path, max_entries=2)
+    assert reopened.get("Beta") is None
+    assert reopened.get("Alpha") == "alpha"
+    assert reopened.get("Gamma") == "gamma"
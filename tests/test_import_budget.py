@@ -0,0 +1,20 @@
+from fraud_core.__main__ import BUDGET_MS, HEAVY_MODULES, LIGHT_MODULES, main, probe
+
+
+def test_light_modules_do_not_import_heavy_dependencies():
+    assert probe()["heavy"] == []
+
+
+def test_import_time_is_within_budget():
+    # The best of a few runs, so one slow start of the interpreter does not fail the suite
+    assert min(probe()["import_ms"] for _ in range(3)) <= BUDGET_MS
+
+
+def test_app_modules_are_probed():
+    assert {"fraud_core.metrics", "fraud_core.parsing", "fraud_core.lookup"} <= set(LIGHT_MODULES)
+    assert {"pandas", "numpy", "pyarrow"} <= set(HEAVY_MODULES)
+
+
+def test_cli_passes(capsys):
+    assert main([]) == 0
+    assert "import fraud_core" in capsys.readouterr().out
@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+import pandas as pd
+
+from fraud_core import lookup
+from fraud_core.lookup import get_retailer_details, stream_retailer_details
+from fraud_core.metrics import Metrics
+from fraud_core.retrieval import RetailerIndex
+
+DATA = pd.DataFrame({"Seller_ID": ["S1"], "Company_Name": ["Acme Ltd"]})
+
+
+class Chain:
+    def invoke(self, inputs):
+        return SimpleNamespace(content="- Legitimacy: Legitimate")
+
+    def stream(self, inputs):
+        yield SimpleNamespace(content="- Legitimacy: ")
+        yield SimpleNamespace(content="Legitimate")
+
+
+def test_a_request_passed_in_is_left_to_the_caller(monkeypatch):
+    metrics = Metrics(enabled=True)
+    monkeypatch.setattr(lookup, "METRICS", metrics)
+    index = RetailerIndex(DATA)
+
+    get_retailer_details("Acme", DATA, index, Chain())
+    assert [request["name"] for request in metrics.requests] == ["lookup"]
+
+    finished = 1
+    for name, run in [("lookup", get_retailer_details), ("stream", lambda *args: "".join(stream_retailer_details(*args)))]:
+        request = metrics.start_request(name)
+        assert run("Acme", DATA, index, Chain(), None, request) == "- Legitimacy: Legitimate"
+        assert len(metrics.requests) == finished
+        # Spans the caller adds afterwards land in the same record
+        with metrics.span("render", request):
+            pass
+        metrics.finish_request(request)
+        finished += 1
+        assert {"search", "prompt", "llm", "render", "request"} <= set(metrics.requests[-1]["spans"])
@@ -0,0 +1,29 @@
+from fraud_core.parsing import Detail, LineParser, legitimacy_style, parse_detail
+
+ANSWER = "- Company Name: Acme Ltd\n- Legitimacy: Not Legitimate\n- Rating: 4.5"
+
+
+def test_lines_split_across_chunks():
+    for size in (1, 3, 7, len(ANSWER)):
+        parser = LineParser()
+        details = []
+        for start in range(0, len(ANSWER), size):
+            details.extend(parser.feed(ANSWER[start:start + size]))
+        # The last line has no newline, so only flush returns it
+        assert [detail.label for detail in details] == ["Company Name", "Legitimacy"]
+        assert parser.flush() == [Detail("Rating", "4.5", "")]
+        assert parser.flush() == []
+
+
+def test_blank_lines_and_lines_without_a_label():
+    parser = LineParser()
+    assert parser.feed("\n\n* just text\n") == [Detail("Unknown", "just text", "")]
+
+
+def test_legitimacy_colouring():
+    assert parse_detail("- Legitimacy: Legitimate").box_style == "legitimate"
+    assert parse_detail("- Legitimacy: Not legitimate").box_style == "not-legitimate"
+    assert parse_detail("- Legitimacy Status: Illegitimate").box_style == "not-legitimate"
+    assert parse_detail("- Legitimacy: No").box_style == "not-legitimate"
+    assert parse_detail("- Legitimacy: Unclear").box_style == ""
+    assert legitimacy_style("Notes", "Legitimate business") == ""
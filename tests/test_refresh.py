@@ -0,0 +1,216 @@
+import json
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fraud_core import refresh
+from fraud_core.refresh import DataReloader, row_hashes
+from fraud_core.store import row_keys
+from fraud_core.synth import write_csvs
+
+
+@pytest.fixture
+def sources(tmp_path):
+    return write_csvs(str(tmp_path / "data"), 300, seed=1)
+
+
+def live_view(snapshot, dead=frozenset()):
+    # Live rows of a snapshot as a frame indexed by seller key, with their scores
+    live = [row for row in range(len(snapshot.data)) if row not in dead]
+    frame = snapshot.data.take(live).reset_index(drop=True)
+    frame["score"] = snapshot.scorer.scores[live]
+    frame.index = row_keys(frame)
+    return frame.sort_index()
+
+
+def found(snapshot, name):
+    return sorted(row_keys(snapshot.data.take(snapshot.index.search(name, 10))).tolist())
+
+
+def assert_matches_fresh(reloader, paths, store_path):
+    # The reloaded state must equal what a restart would load from the same files
+    fresh = DataReloader(paths, store_path=str(store_path))
+    current = live_view(reloader.current, reloader.dead)
+    expected = live_view(fresh.current)
+    assert current.index.is_unique
+    assert sorted(row_hashes(current)) == sorted(row_hashes(expected))
+    assert current.index.equals(expected.index)
+    np.testing.assert_allclose(current["score"], expected["score"], equal_nan=True)
+    names = expected["Company_Name"].dropna().sample(40, random_state=0)
+    for name in [*names, *(name[:-1] for name in names)]:
+        assert found(reloader.current, name) == found(fresh.current, name)
+
+
+def append_rows(path, frame):
+    with open(path, "a") as handle:
+        handle.write(frame.to_csv(header=False, index=False))
+
+
+def test_append_new_changed_and_repeated_lines(sources, tmp_path):
+    reloader = DataReloader(sources, store_path=str(tmp_path / "live" / "store.arrow"))
+    frame = pd.read_csv(sources[0], dtype=str)
+    changed = frame.head(3).copy()
+    changed["Verified_Status"] = "Not Verified"
+    new = frame.tail(2).copy()
+    new["Seller_ID"] = ["X1", "X2"]
+    new["Company_Name"] = ["Quartzline Traders", "Hollowbrook Supply"]
+    append_rows(sources[0], pd.concat([changed, new, frame.iloc[[5]]]))
+
+    assert reloader.refresh() > 0
+    assert found(reloader.current, "Quartzline Traders")
+    assert_matches_fresh(reloader, sources, tmp_path / "fresh" / "store.arrow")
+
+
+def test_restart_keeps_last_line_of_a_seller(sources, tmp_path):
+    frame = pd.read_csv(sources[0], dtype=str)
+    stale = frame.iloc[[0]].copy()
+    stale["Dispute_Resolution_Rate"] = "40%"
+    append_rows(sources[0], stale)
+
+    reloader = DataReloader(sources, store_path=str(tmp_path / "live" / "store.arrow"))
+    rows = reloader.current.index.search(stale["Company_Name"].iloc[0])
+    assert reloader.current.data.take(rows)["Dispute_Resolution_Rate"].tolist() == [40.0]
+    assert_matches_fresh(reloader, sources, tmp_path / "fresh" / "store.arrow")
+
+
+def test_rewrite_drops_and_changes_rows(sources, tmp_path):
+    reloader = DataReloader(sources, store_path=str(tmp_path / "live" / "store.arrow"))
+    frame = pd.read_csv(sources[1], dtype=str)
+    frame = frame.drop(frame.index[:4])
+    frame.loc[frame.index[:3], "Legitimacy_Score"] = "5"
+    frame.to_csv(sources[1], index=False)
+
+    assert reloader.refresh() == 4 + 3 * 2
+    assert_matches_fresh(reloader, sources, tmp_path / "fresh" / "store.arrow")
+
+
+def test_feed_upsert_and_delete(sources, tmp_path):
+    feed = tmp_path / "feed.jsonl"
+    reloader = DataReloader(sources, store_path=str(tmp_path / "live" / "store.arrow"), feed=str(feed))
+    frame = pd.read_csv(sources[0], dtype=str)
+    upserted = frame.iloc[1].copy()
+    upserted["Customer_Service_Score"] = "1"
+    added = frame.iloc[2].copy()
+    added["Seller_ID"] = "F1"
+    operations = [
+        {"op": "upsert", "source": "data.csv", "row": upserted.to_dict()},
+        {"op": "upsert", "source": "data.csv", "row": added.to_dict()},
+        {"op": "delete", "source": "data.csv", "Seller_ID": frame["Seller_ID"].iloc[3]},
+    ]
+    feed.write_text("".join(json.dumps(operation) + "\n" for operation in operations))
+    assert reloader.refresh() == 1 + 1 * 2 + 1
+    # A replayed feed changes nothing
+    feed.write_text(feed.read_text())
+    assert reloader.refresh() == 0
+
+    # Applying the same changes to the file and loading it fresh must give the same state
+    expected = frame.copy()
+    expected.iloc[1] = upserted
+    expected = pd.concat([expected.drop(expected.index[3]), added.to_frame().T])
+    expected.to_csv(sources[0], index=False)
+    reloader.files[0].mark()
+    assert_matches_fresh(reloader, sources, tmp_path / "fresh" / "store.arrow")
+
+
+def test_random_changes_and_compaction(tmp_path):
+    # A small catalog, so the deltas pass the compaction threshold within a few steps
+    sources = write_csvs(str(tmp_path / "data"), 120, seed=2)
+    reloader = DataReloader(sources, store_path=str(tmp_path / "live" / "store.arrow"))
+    rng = random.Random(0)
+    compactions = 0
+    for step in range(16):
+        path = rng.choice(sources)
+        frame = pd.read_csv(path, dtype=str)
+        if rng.random() < 0.6:
+            extra = frame.sample(rng.randint(1, 5), random_state=step).copy()
+            extra["Customer_Service_Score"] = [str(rng.randint(1, 10)) for _ in range(len(extra))]
+            if rng.random() < 0.5:
+                extra["Seller_ID"] = [f"N{step}_{i}" for i in range(len(extra))]
+                extra["Company_Name"] = [f"Newco {step} {i}" for i in range(len(extra))]
+            append_rows(path, extra)
+        else:
+            frame = frame.drop(frame.sample(3, random_state=step).index)
+            frame.loc[frame.sample(3, random_state=step + 1).index, "Customer_Service_Score"] = "2"
+            frame.to_csv(path, index=False)
+        base_rows = reloader.base_rows
+        reloader.refresh()
+        compactions += reloader.base_rows != base_rows
+        assert_matches_fresh(reloader, sources, tmp_path / f"fresh{step}" / "store.arrow")
+    assert compactions
+
+
+def test_snapshot_is_not_changed_by_refresh(sources, tmp_path):
+    reloader = DataReloader(sources, store_path=str(tmp_path / "live" / "store.arrow"))
+    snapshot = reloader.current
+    scores = snapshot.scorer.scores.copy()
+    frame = pd.read_csv(sources[0], dtype=str)
+    changed = frame.head(5).copy()
+    changed["Verified_Status"] = "Not Verified"
+    append_rows(sources[0], changed)
+    reloader.refresh()
+
+    assert reloader.current.version > snapshot.version
+    assert len(snapshot.data) == len(scores)
+    np.testing.assert_array_equal(snapshot.scorer.scores, scores)
+    name = frame["Company_Name"].iloc[0]
+    assert snapshot.data.take(snapshot.index.search(name))["Verified_Status"].tolist() != ["Not Verified"]
+
+
+def test_failed_refresh_is_retried(sources, tmp_path, monkeypatch):
+    feed = tmp_path / "feed.jsonl"
+    reloader = DataReloader(sources, store_path=str(tmp_path / "live" / "store.arrow"), feed=str(feed))
+    frame = pd.read_csv(sources[0], dtype=str)
+    new = frame.head(3).copy()
+    new["Seller_ID"] = ["Z1", "Z2", "Z3"]
+    new["Company_Name"] = ["Zyxwq One", "Zyxwq Two", "Zyxwq Three"]
+    append_rows(sources[0], new)
+    feed.write_text(json.dumps({"op": "delete", "source": "data.csv", "Seller_ID": frame["Seller_ID"].iloc[5]}) + "\n")
+
+    build = refresh.RetailerIndex
+    calls = []
+
+    def failing_once(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("index build failed")
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(refresh, "RetailerIndex", failing_once)
+    snapshot = reloader.current
+    with pytest.raises(RuntimeError):
+        reloader.refresh()
+    assert reloader.current is snapshot
+    assert not reloader.dead
+
+    assert reloader.refresh() == 3 + 1
+    assert found(reloader.current, "Zyxwq One") == ["data.csv\x1fZ1"]
+    assert reloader.refresh() == 0
+
+    # The fresh load sees the feed's delete through the file
+    pd.concat([frame.drop(frame.index[5]), new]).to_csv(sources[0], index=False)
+    reloader.files[0].mark()
+    assert_matches_fresh(reloader, sources, tmp_path / "fresh" / "store.arrow")
+
+
+def test_lines_appended_while_a_rewrite_is_read(sources, tmp_path, monkeypatch):
+    reloader = DataReloader(sources, store_path=str(tmp_path / "live" / "store.arrow"))
+    frame = pd.read_csv(sources[0], dtype=str)
+    frame.drop(frame.index[:2]).to_csv(sources[0], index=False)
+    late = frame.head(1).copy()
+    late["Seller_ID"] = "L1"
+    late["Company_Name"] = "Latecomer Holdings"
+    diff_file = reloader.diff_file
+
+    def append_during_diff(path):
+        result = diff_file(path)
+        append_rows(path, late)
+        return result
+
+    monkeypatch.setattr(reloader, "diff_file", append_during_diff)
+    assert reloader.refresh() == 2
+    monkeypatch.undo()
+    assert reloader.refresh() == 1
+    assert found(reloader.current, "Latecomer Holdings") == ["data.csv\x1fL1"]
+    assert_matches_fresh(reloader, sources, tmp_path / "fresh" / "store.arrow")
@@ -0,0 +1,66 @@
+import pandas as pd
+
+from fraud_core import retrieval
+from fraud_core.lookup import get_retailer_details
+from fraud_core.retrieval import LayeredIndex, RetailerIndex
+
+DATA = pd.DataFrame({
+    "Seller_ID": ["S1", "S2", "S3", "S4", "S5"],
+    "Company_Name": ["TechGadgets Inc.", "EcoFriendly Goods", "Alpha Trading", "Beta Trading", None],
+})
+
+
+def test_exact_match_ignores_case_and_covers_seller_ids():
+    index = RetailerIndex(DATA)
+    assert index.search("techgadgets inc.") == [0]
+    assert index.search("  ECOFRIENDLY GOODS ") == [1]
+    assert index.search("s4") == [3]
+
+
+def test_normalized_match_drops_punctuation_and_suffixes():
+    index = RetailerIndex(DATA)
+    assert index.search("TechGadgets") == [0]
+    assert index.search("eco-friendly goods ltd") == [1]
+
+
+def test_trigram_match_tolerates_typos():
+    index = RetailerIndex(DATA)
+    assert index.search("TechGadgts")[0] == 0
+    assert index.search("Alpha Tradin")[0] == 2
+
+
+def test_no_match():
+    index = RetailerIndex(DATA)
+    assert index.search("Zyxwvut Qqq") == []
+    assert index.search("") == []
+    assert index.search("Inc.") == []
+
+
+def test_trigrams_of_too_many_names_are_not_read(monkeypatch):
+    monkeypatch.setattr(retrieval, "MAX_GRAM_NAMES", 1)
+    index = RetailerIndex(DATA)
+    # Every trigram of "trading" is shared by two names, so no candidate is collected
+    assert index.search("Tradingg") == []
+    assert index.search("TechGadgts")[0] == 0
+
+
+def test_postings_read_per_query_are_capped(monkeypatch):
+    index = RetailerIndex(DATA)
+    monkeypatch.setattr(retrieval, "MAX_POSTINGS", 0)
+    assert index.search("TechGadgts") == []
+    assert index.search("TechGadgets") == [0]
+
+
+def test_layers_skip_dead_rows():
+    delta = pd.DataFrame({"Seller_ID": ["S2"], "Company_Name": ["EcoFriendly Goods"]})
+    layered = LayeredIndex([RetailerIndex(DATA), RetailerIndex(delta, offset=len(DATA))], dead=frozenset({1}))
+    assert layered.search("EcoFriendly Goods") == [5]
+    assert layered.search("EcoFriendli Goods") == [5]
+
+
+def test_lookup_without_a_match_does_not_call_the_model():
+    class Unreachable:
+        def invoke(self, inputs):
+            raise AssertionError("the model was called")
+
+    assert get_retailer_details("Zyxwvut Qqq", DATA, RetailerIndex(DATA), Unreachable()) == "No information available"
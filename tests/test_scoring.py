@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+
+from fraud_core.scoring import LegitimacyScorer, parse_percent
+
+
+def test_parse_percent_accepts_strings_and_numbers():
+    assert parse_percent(pd.Series(["98%", " 40 ", None, "n/a"])).tolist()[:2] == [98.0, 40.0]
+    assert parse_percent(pd.Series(["98%", None, "n/a"])).isna().tolist() == [False, True, True]
+    numbers = pd.Series([95.0, np.nan, 12])
+    parsed = parse_percent(numbers)
+    assert parsed.dtype == "float64"
+    np.testing.assert_array_equal(parsed, numbers)
+
+
+def test_stored_floats_score_like_csv_strings():
+    strings = pd.DataFrame({"Verified_Status": ["Verified", "No"], "Dispute_Resolution_Rate": ["98%", "40%"]})
+    floats = strings.assign(Dispute_Resolution_Rate=[98.0, 40.0])
+    np.testing.assert_array_equal(LegitimacyScorer(strings).scores, LegitimacyScorer(floats).scores)